@@ -1,19 +1,106 @@
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from sportsreference.nfl.boxscore import Boxscore
 from sportsreference.nfl.teams import Teams
 from sportsreference.nfl.schedule import Schedule
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+from datetime import datetime, timedelta, date
+from types import SimpleNamespace
+import random
 import re
+import shelve
+import sys
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+from collections import defaultdict
 from termcolor import cprint
+from rate_limited_sheets import RateLimiter
+
+# sports-reference rate limits aggressively, so keep concurrent lookups small
+MAX_BOXSCORE_WORKERS = 8
+
+SEASON = 2025  # Assuming 2025 season, adjust as needed
+
+# Transient API failures worth retrying (quota exceeded / server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 503}
+
+def _retry(fn, *, tries: int = 5, base: float = 0.5):
+    """Call fn, retrying transient Sheets/sports-reference failures with exponential backoff"""
+    for attempt in range(tries):
+        try:
+            return fn()
+        except (HttpError, RequestsConnectionError) as e:
+            if isinstance(e, HttpError) and getattr(e.resp, 'status', None) not in RETRYABLE_STATUS_CODES:
+                raise
+            if attempt == tries - 1:
+                raise
+            delay = base * 2 ** attempt + random.uniform(0, 0.25)
+            cprint(f"⏳ Request failed ({e}), retrying in {delay:.1f}s...", "yellow")
+            time.sleep(delay)
+
+# Completed games never change, so their boxscores are persisted once they are a day old
+BOXSCORE_CACHE_FILE = '.boxscore_cache.db'
+BOXSCORE_CACHE_MIN_AGE = timedelta(hours=24)
+
+# Player attributes kept in the on-disk boxscore cache
+CACHED_PLAYER_ATTRS = (
+    'name', 'passing_yards', 'passing_touchdowns', 'passing_attempts', 'passing_completions',
+    'interceptions', 'rushing_yards', 'rushing_touchdowns', 'rushing_attempts',
+    'receiving_yards', 'receiving_touchdowns', 'receptions', 'receiving_targets',
+    'field_goals_made', 'kicking_points', 'sacks', 'tackles', 'assists'
+)
+
+@dataclass(slots=True)
+class PlayerRow:
+    """One prop row from a results sheet"""
+    row_index: int
+    player_name: str
+    position: str
+    team: str
+    opponent: str
+    game_time: str
+    line: Union[str, float] = ''
+    payout_type: str = 'Standard'
+    actual: Union[str, float] = ''
+    over_under: str = ''
+    stat_type: str = ''
 
 class ActualResultsFetcher:
-    def __init__(self, spreadsheet_id: str, service_account_file: str = 'service-account-key.json'):
+    # Game time strings like "Thu 7:20pm" or "Sun 1:00PM"
+    _GAME_TIME_RE = re.compile(r'(\w{3})\s+(\d{1,2}):(\d{2})([ap]m)', re.IGNORECASE)
+    _DAY_MAP = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+
+    # Basic fantasy scoring: 1 point per 25 passing yards, 4 per passing TD, etc.
+    FANTASY_COEFFS = {
+        'passing_yards': 0.04,
+        'passing_touchdowns': 4,
+        'rushing_yards': 0.1,
+        'rushing_touchdowns': 6,
+        'receiving_yards': 0.1,
+        'receiving_touchdowns': 6,
+        'receptions': 1,
+        'interceptions': -2
+    }
+
+    def __init__(self, spreadsheet_id: str, service_account_file: str = 'service-account-key.json',
+                 boxscore_cache_file: str = BOXSCORE_CACHE_FILE, sheets_service=None):
         self.spreadsheet_id = spreadsheet_id
         self.service_account_file = service_account_file
-        self.sheets_service = self._setup_google_sheets()
+        self.sheets_service = sheets_service or self._setup_google_sheets()
+        self._disk_cache = self._open_disk_cache(boxscore_cache_file)
+        
+        # Sheets' default quota is 60 requests per minute per user
+        self._rate_limiter = RateLimiter(rate=60, per=60.0)
+        
+        # sports-reference scrapes are reused across players on the same team/game
+        self._teams_cache: Dict[int, Teams] = {}
+        self._schedule_cache: Dict[Tuple[int, str], list] = {}
+        self._boxscore_cache: Dict[str, Boxscore] = {}
+        self._cache_lock = threading.Lock()
         
         # Team abbreviation mapping for sportsreference
         self.team_mapping = {
@@ -25,6 +112,7 @@ class ActualResultsFetcher:
             'PHI': 'PHI', 'PIT': 'PIT', 'SF': 'SFO', 'SEA': 'SEA', 'TB': 'TAM',
             'TEN': 'TEN', 'WAS': 'WAS'
         }
+        self.code_to_team = {code: team for team, code in self.team_mapping.items()}
         
         # Stat type mapping to sportsreference attributes
         self.stat_mapping = {
@@ -57,69 +145,116 @@ class ActualResultsFetcher:
             cprint(f"Error setting up Google Sheets: {e}", "red")
             return None
 
-    def read_sheet_data(self, sheet_name: str) -> List[Dict[str, Any]]:
+    def _open_disk_cache(self, cache_file: str):
         try:
-            range_name = f"'{sheet_name}'!A:I"
-            result = self.sheets_service.spreadsheets().values().get(
+            return shelve.open(cache_file)
+        except Exception as e:
+            cprint(f"Boxscore cache unavailable, continuing without it: {e}", "yellow")
+            return None
+
+    def close(self):
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def _execute(self, request):
+        # Every attempt, including retries, spends a token from the Sheets quota
+        def call():
+            self._rate_limiter.acquire()
+            return request.execute()
+        return _retry(call)
+
+    def iter_sheet_rows(self, sheet_name: str, values: List[List[Any]]) -> Iterator[PlayerRow]:
+        # values start at row 2 (header excluded by the range) and are unformatted,
+        # so numeric cells arrive as numbers rather than display strings.
+        # Position, teams and game time repeat across thousands of rows, so they are
+        # interned: one shared copy each, and game-key lookups compare by identity
+        intern = sys.intern
+        stat_type = intern(sheet_name.replace(' Plus ', '+'))
+        for i, row in enumerate(values, start=2):
+            if len(row) >= 5:
+                yield PlayerRow(
+                    row_index=i,
+                    player_name=str(row[0]).strip(),
+                    position=intern(str(row[1]).strip()),
+                    team=intern(str(row[2]).strip()),
+                    opponent=intern(str(row[3]).strip()),
+                    game_time=intern(str(row[4]).strip()),
+                    line=row[5] if len(row) > 5 else '',
+                    payout_type=row[6] if len(row) > 6 else 'Standard',
+                    actual=row[7] if len(row) > 7 else '',
+                    over_under=row[8] if len(row) > 8 else '',
+                    stat_type=stat_type
+                )
+
+    def read_sheet_data(self, sheet_name: str) -> List[PlayerRow]:
+        try:
+            range_name = f"'{sheet_name}'!A2:I"
+            result = self._execute(self.sheets_service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
-            
-            values = result.get('values', [])
-            if len(values) <= 1:
-                return []
-            
-            players = []
-            for row in values[1:]:  # Skip header
-                if len(row) >= 5:
-                    players.append({
-                        'player_name': row[0].strip(),
-                        'position': row[1].strip(),
-                        'team': row[2].strip(),
-                        'opponent': row[3].strip(),
-                        'game_time': row[4].strip(),
-                        'line': row[5] if len(row) > 5 else '',
-                        'payout_type': row[6] if len(row) > 6 else 'Standard',
-                        'actual': row[7] if len(row) > 7 else '',
-                        'over_under': row[8] if len(row) > 8 else '',
-                        'stat_type': sheet_name.replace(' Plus ', '+')
-                    })
-            
-            return players
+                range=range_name,
+                valueRenderOption='UNFORMATTED_VALUE'
+            ))
+            
+            return list(self.iter_sheet_rows(sheet_name, result.get('values', [])))
         except Exception as e:
             cprint(f"Error reading sheet {sheet_name}: {e}", "red")
             return []
 
+    def read_all_sheet_values(self, sheet_names: List[str]) -> Dict[str, List[List[Any]]]:
+        """Read every sheet in a single values.batchGet round trip"""
+        if not sheet_names:
+            return {}
+        
+        try:
+            result = self._execute(self.sheets_service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=[f"'{sheet_name}'!A2:I" for sheet_name in sheet_names],
+                valueRenderOption='UNFORMATTED_VALUE',
+                fields='valueRanges.values'
+            ))
+            
+            # valueRanges come back in the same order as the requested ranges
+            value_ranges = result.get('valueRanges', [])
+            return {
+                sheet_name: value_range.get('values', [])
+                for sheet_name, value_range in zip(sheet_names, value_ranges)
+            }
+        except Exception as e:
+            cprint(f"Error batch reading sheets: {e}", "red")
+            return {}
+
     def get_all_sheets(self) -> List[str]:
         try:
-            spreadsheet = self.sheets_service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id).execute()
+            spreadsheet = self._execute(self.sheets_service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties.title'))
             return [sheet['properties']['title'] for sheet in spreadsheet['sheets']]
         except Exception as e:
             cprint(f"Error getting sheet names: {e}", "red")
             return []
 
-    def parse_game_date(self, game_time_str: str) -> Optional[datetime]:
+    def parse_game_date(self, game_time_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
         try:
-            match = re.match(r'(\w{3})\s+(\d{1,2}):(\d{2})([ap]m)', game_time_str.strip())
+            match = self._GAME_TIME_RE.match(game_time_str.strip())
             if not match:
                 return None
             
             day_abbr, hour, minute, ampm = match.groups()
             hour = int(hour)
             minute = int(minute)
+            ampm = ampm.lower()
             
-            if ampm.lower() == 'pm' and hour != 12:
+            if ampm == 'pm' and hour != 12:
                 hour += 12
-            elif ampm.lower() == 'am' and hour == 12:
+            elif ampm == 'am' and hour == 12:
                 hour = 0
             
-            day_map = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
-            day_num = day_map.get(day_abbr.lower())
+            day_num = self._DAY_MAP.get(day_abbr.lower())
             if day_num is None:
                 return None
             
-            today = datetime.now()
+            today = now or datetime.now()
             days_ahead = (day_num - today.weekday()) % 7
             if days_ahead == 0 and (hour < today.hour or (hour == today.hour and minute <= today.minute)):
                 days_ahead = 7
@@ -131,29 +266,103 @@ class ActualResultsFetcher:
             cprint(f"Error parsing game time '{game_time_str}': {e}", "red")
             return None
 
+    def _get_team_schedule(self, season: int, team_code: str) -> Optional[list]:
+        key = (season, team_code)
+        with self._cache_lock:
+            if key in self._schedule_cache:
+                return self._schedule_cache[key]
+            
+            if season not in self._teams_cache:
+                self._teams_cache[season] = _retry(lambda: Teams(season))
+            teams = self._teams_cache[season]
+        
+        team_obj = teams(team_code)
+        if not team_obj:
+            return None
+        
+        schedule = _retry(lambda: list(team_obj.schedule))
+        with self._cache_lock:
+            self._schedule_cache[key] = schedule
+        return schedule
+
+    def _get_boxscore(self, game) -> Optional[Boxscore]:
+        # Both teams' schedules point at the same boxscore, so key by its URI
+        uri = game.boxscore_index
+        with self._cache_lock:
+            if uri in self._boxscore_cache:
+                return self._boxscore_cache[uri]
+        
+        boxscore = _retry(lambda: game.boxscore)
+        with self._cache_lock:
+            self._boxscore_cache[uri] = boxscore
+        return boxscore
+
+    def _read_cached_boxscore(self, cache_key: str) -> Optional[SimpleNamespace]:
+        if self._disk_cache is None:
+            return None
+        
+        with self._cache_lock:
+            snapshot = self._disk_cache.get(cache_key)
+        if snapshot is None:
+            return None
+        
+        # Same shape as a Boxscore as far as the stat lookups are concerned
+        return SimpleNamespace(
+            away_players=[SimpleNamespace(**player) for player in snapshot['away_players']],
+            home_players=[SimpleNamespace(**player) for player in snapshot['home_players']]
+        )
+
+    def _write_cached_boxscore(self, cache_key: str, boxscore: Boxscore):
+        if self._disk_cache is None:
+            return
+        
+        try:
+            snapshot = {
+                side: [{attr: getattr(player, attr, None) for attr in CACHED_PLAYER_ATTRS}
+                       for player in getattr(boxscore, side)]
+                for side in ('away_players', 'home_players')
+            }
+            with self._cache_lock:
+                self._disk_cache[cache_key] = snapshot
+        except Exception as e:
+            cprint(f"Error caching boxscore {cache_key}: {e}", "yellow")
+
+    def _to_team_code(self, team: str) -> Optional[str]:
+        # Accept either the sheet abbreviation (e.g. "GB") or a sportsreference code (e.g. "GNB")
+        team = team.strip().upper()
+        if team in self.code_to_team:
+            return team
+        return self.team_mapping.get(team)
+
     def find_game_boxscore(self, team: str, opponent: str, game_date: datetime) -> Optional[Boxscore]:
         try:
-            team_code = self.team_mapping.get(team)
-            opponent_code = self.team_mapping.get(opponent)
+            team_code = self._to_team_code(team)
+            opponent_code = self._to_team_code(opponent)
             
             if not team_code or not opponent_code:
                 cprint(f"Unknown team codes: {team} -> {team_code}, {opponent} -> {opponent_code}", "red")
                 return None
             
-            # Get team schedule to find the game
-            teams = Teams(2025)  # Assuming 2025 season, adjust as needed
-            team_obj = teams(team_code)
+            valid_opp = {opponent_code}
+            
+            cache_key = f"{team_code}:{opponent_code}:{game_date.date().isoformat()}"
+            cached = self._read_cached_boxscore(cache_key)
+            if cached is not None:
+                return cached
             
-            if not team_obj:
+            # Get team schedule to find the game
+            schedule = self._get_team_schedule(SEASON, team_code)
+            if schedule is None:
                 cprint(f"Team {team_code} not found", "red")
                 return None
             
-            schedule = team_obj.schedule
+            target_date = game_date.date()
             for game in schedule:
-                game_date_obj = game.date
-                if (game_date_obj.date() == game_date.date() and 
-                    (game.opponent_abbr == opponent_code or game.opponent_abbr == team_code)):
-                    return game.boxscore
+                if game.date.date() == target_date and game.opponent_abbr in valid_opp:
+                    boxscore = self._get_boxscore(game)
+                    if boxscore and game_date < datetime.now() - BOXSCORE_CACHE_MIN_AGE:
+                        self._write_cached_boxscore(cache_key, boxscore)
+                    return boxscore
             
             return None
             
@@ -161,28 +370,27 @@ class ActualResultsFetcher:
             cprint(f"Error finding game boxscore for {team} vs {opponent}: {e}", "red")
             return None
 
-    def get_player_stats(self, boxscore: Boxscore, player_name: str, stat_type: str) -> Optional[float]:
+    def _roster_index(self, boxscore) -> Dict[str, Any]:
+        # Built once per boxscore and stashed on it so repeat lookups are a dict hit
+        index = getattr(boxscore, '_name_index', None)
+        if index is None:
+            index = {player.name.lower().strip(): player
+                     for player in boxscore.away_players + boxscore.home_players}
+            setattr(boxscore, '_name_index', index)
+        return index
+
+    def _find_player(self, boxscore, player_name: str):
         try:
-            if not boxscore:
-                return None
-            
-            # Map stat type to sportsreference attribute
-            stat_attr = self.stat_mapping.get(stat_type)
-            if not stat_attr:
-                return None
-            
+            index = self._roster_index(boxscore)
             player_name_lower = player_name.lower().strip()
-            player_match = None
             
-            # Search through all players in the boxscore
-            for player in boxscore.away_players + boxscore.home_players:
-                pbp_name = player.name.lower().strip()
-                
-                # Try exact match first
-                if pbp_name == player_name_lower:
-                    player_match = player
-                    break
-                
+            # Try exact match first
+            player_match = index.get(player_name_lower)
+            if player_match is not None:
+                return player_match
+            
+            # Fall back to fuzzy matching against the roster
+            for pbp_name, player in index.items():
                 # Try partial match
                 if player_match is None:
                     name_parts = player_name_lower.split()
@@ -245,6 +453,24 @@ class ActualResultsFetcher:
                                     player_match = player
                                     break
             
+            return player_match
+            
+        except Exception as e:
+            cprint(f"Error matching player {player_name}: {e}", "red")
+            return None
+
+    def get_player_stats(self, boxscore: Boxscore, player_name: str, stat_type: str) -> Optional[float]:
+        try:
+            if not boxscore:
+                return None
+            
+            # Map stat type to sportsreference attribute
+            stat_attr = self.stat_mapping.get(stat_type)
+            if not stat_attr:
+                return None
+            
+            player_match = self._find_player(boxscore, player_name)
+            
             if player_match and hasattr(player_match, stat_attr):
                 value = getattr(player_match, stat_attr)
                 return float(value) if value is not None else 0.0
@@ -260,79 +486,7 @@ class ActualResultsFetcher:
             if not boxscore:
                 return None
             
-            player_name_lower = player_name.lower().strip()
-            player_match = None
-            
-            # Search through all players in the boxscore
-            for player in boxscore.away_players + boxscore.home_players:
-                pbp_name = player.name.lower().strip()
-                
-                # Try exact match first
-                if pbp_name == player_name_lower:
-                    player_match = player
-                    break
-                
-                # Try partial match
-                if player_match is None:
-                    name_parts = player_name_lower.split()
-                    pbp_parts = pbp_name.split()
-                    if len(name_parts) >= 2 and len(pbp_parts) >= 2:
-                        if (name_parts[0] in pbp_parts[0] and 
-                            name_parts[-1] in pbp_parts[-1]):
-                            player_match = player
-                            break
-                
-                # Try abbreviated name matching (e.g., "Jalen Hurts" vs "J.Hurts" or "J Hurts")
-                if player_match is None:
-                    # Handle "J.Hurts" format
-                    if '.' in pbp_name:
-                        pbp_parts = pbp_name.split('.')
-                        if len(pbp_parts) == 2:
-                            first_initial = pbp_parts[0]
-                            last_name = pbp_parts[1]
-                            if (player_name_lower.split()[0].startswith(first_initial) and 
-                                player_name_lower.endswith(last_name)):
-                                player_match = player
-                                break
-                    
-                    # Handle "J Hurts" format (first initial + space + last name)
-                    elif ' ' in pbp_name:
-                        pbp_parts = pbp_name.split(' ', 1)
-                        if len(pbp_parts) == 2 and len(pbp_parts[0]) == 1:
-                            first_initial = pbp_parts[0]
-                            last_name = pbp_parts[1]
-                            if (player_name_lower.split()[0].startswith(first_initial) and 
-                                player_name_lower.endswith(last_name)):
-                                player_match = player
-                                break
-                
-                # Try reverse abbreviated matching
-                if player_match is None:
-                    name_parts = player_name_lower.split()
-                    if len(name_parts) >= 2:
-                        first_name = name_parts[0]
-                        last_name = name_parts[-1]
-                        first_initial = first_name[0]
-                        
-                        # Handle "J.Hurts" format
-                        if '.' in pbp_name:
-                            pbp_parts = pbp_name.split('.')
-                            if len(pbp_parts) == 2:
-                                pbp_initial = pbp_parts[0]
-                                pbp_last = pbp_parts[1]
-                                if (first_initial == pbp_initial and last_name == pbp_last):
-                                    player_match = player
-                                    break
-                        
-                        # Handle "J Hurts" format
-                        elif ' ' in pbp_name:
-                            pbp_parts = pbp_name.split(' ', 1)
-                            if len(pbp_parts) == 2 and len(pbp_parts[0]) == 1:
-                                pbp_initial = pbp_parts[0]
-                                pbp_last = pbp_parts[1]
-                                if (first_initial == pbp_initial and last_name == pbp_last):
-                                    player_match = player
-                                    break
+            player_match = self._find_player(boxscore, player_name)
             
             if player_match:
                 if stat_type == 'Rush+Rec Yds':
@@ -346,21 +500,8 @@ class ActualResultsFetcher:
                     return pass_yards + rush_yards
                 
                 elif stat_type == 'Fantasy Score':
-                    # Basic fantasy scoring: 1 point per 25 passing yards, 4 per passing TD, etc.
-                    pass_yards = float(player_match.passing_yards) if player_match.passing_yards else 0.0
-                    pass_tds = float(player_match.passing_touchdowns) if player_match.passing_touchdowns else 0.0
-                    rush_yards = float(player_match.rushing_yards) if player_match.rushing_yards else 0.0
-                    rush_tds = float(player_match.rushing_touchdowns) if player_match.rushing_touchdowns else 0.0
-                    rec_yards = float(player_match.receiving_yards) if player_match.receiving_yards else 0.0
-                    rec_tds = float(player_match.receiving_touchdowns) if player_match.receiving_touchdowns else 0.0
-                    receptions = float(player_match.receptions) if player_match.receptions else 0.0
-                    interceptions = float(player_match.interceptions) if player_match.interceptions else 0.0
-                    
-                    fantasy_points = (
-                        (pass_yards / 25) + (pass_tds * 4) + (rush_yards / 10) + (rush_tds * 6) +
-                        (rec_yards / 10) + (rec_tds * 6) + receptions - (interceptions * 2)
-                    )
-                    return fantasy_points
+                    return sum(coeff * float(getattr(player_match, attr) or 0)
+                               for attr, coeff in self.FANTASY_COEFFS.items())
                 
                 elif stat_type == 'Tackles+Ast':
                     tackles = float(player_match.tackles) if player_match.tackles else 0.0
@@ -373,86 +514,136 @@ class ActualResultsFetcher:
             cprint(f"Error calculating combined stats for {player_name}: {e}", "red")
             return None
 
-    def update_actual_results(self, sheet_name: str, players: List[Dict[str, Any]]) -> int:
+    def _fetch_boxscores(self, games: Dict[Tuple[str, str, date], datetime]) -> Dict[Tuple[str, str, date], Optional[Boxscore]]:
+        if not games:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_BOXSCORE_WORKERS, len(games))) as executor:
+            futures = {
+                key: executor.submit(self.find_game_boxscore, key[0], key[1], game_date)
+                for key, game_date in games.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def _resolve_player_result(self, boxscore: Boxscore, player: PlayerRow) -> Optional[Dict[str, Any]]:
+        # Get player stats
+        stat_type = player.stat_type
+        if stat_type in ['Rush+Rec Yds', 'Pass+Rush Yds', 'Fantasy Score', 'Tackles+Ast']:
+            actual_value = self.calculate_combined_stats(boxscore, player.player_name, stat_type)
+        else:
+            actual_value = self.get_player_stats(boxscore, player.player_name, stat_type)
+        
+        if actual_value is None:
+            cprint(f"Could not find stats for {player.player_name}", "red")
+            return None
+        
+        cprint(f"Found actual result for {player.player_name}: {actual_value}", "green")
+        line_value = float(player.line) if player.line != '' else 0
+        return {
+            'row': player.row_index,
+            'player': player.player_name,
+            'actual': actual_value,
+            'line': line_value,
+            'over_under': '' if player.line == '' else ('Over' if actual_value > line_value else 'Under')
+        }
+
+    def update_actual_results(self, sheet_name: str, players: Iterable[PlayerRow],
+                              pending_ranges: Optional[List[Dict[str, Any]]] = None) -> int:
+        # When pending_ranges is given, writes are queued for the caller to flush in one batch
         updates = []
+        games = {}
+        game_groups = defaultdict(list)
+        now = datetime.now()
         
         for player in players:
-            if player['actual']:  # Skip if already has actual result
+            if player.actual != '':  # Skip if already has actual result (0 is a valid result)
+                continue
+            
+            if not player.game_time:
+                cprint(f"No game time for {player.player_name}", "red")
                 continue
             
-            game_date = self.parse_game_date(player['game_time'])
+            game_date = self.parse_game_date(player.game_time, now)
             if not game_date:
-                cprint(f"Could not parse game date for {player['player_name']}", "red")
+                cprint(f"Could not parse game date for {player.player_name}", "red")
                 continue
             
             # Check if game has been played (game date is in the past)
-            if game_date > datetime.now():
-                cprint(f"Game for {player['player_name']} hasn't been played yet", "yellow")
+            if game_date > now:
+                cprint(f"Game for {player.player_name} hasn't been played yet", "yellow")
                 continue
             
-            boxscore = self.find_game_boxscore(player['team'], player['opponent'], game_date)
+            game_key = (player.team, player.opponent, game_date.date())
+            games.setdefault(game_key, game_date)
+            game_groups[game_key].append(player)
+        
+        # Look up each distinct game once, concurrently
+        boxscores = self._fetch_boxscores(games)
+        
+        for game_key, group in game_groups.items():
+            boxscore = boxscores.get(game_key)
             if not boxscore:
-                cprint(f"Could not find boxscore for {player['team']} vs {player['opponent']}", "red")
+                cprint(f"Could not find boxscore for {game_key[0]} vs {game_key[1]} ({len(group)} players)", "red")
                 continue
             
-            # Get player stats
-            stat_type = player['stat_type']
-            if stat_type in ['Rush+Rec Yds', 'Pass+Rush Yds', 'Fantasy Score', 'Tackles+Ast']:
-                actual_value = self.calculate_combined_stats(boxscore, player['player_name'], stat_type)
-            else:
-                actual_value = self.get_player_stats(boxscore, player['player_name'], stat_type)
-            
-            if actual_value is not None:
-                updates.append({
-                    'row': players.index(player) + 2,  # +2 because we skip header and 0-indexed
-                    'player': player['player_name'],
-                    'actual': actual_value,
-                    'line': float(player['line']) if player['line'] else 0,
-                    'over_under': 'Over' if actual_value > float(player['line']) else 'Under' if player['line'] else ''
-                })
-                cprint(f"Found actual result for {player['player_name']}: {actual_value}", "green")
-            else:
-                cprint(f"Could not find stats for {player['player_name']}", "red")
+            # The boxscore's name index is built on the first lookup and reused for the rest of the group
+            for player in group:
+                result = self._resolve_player_result(boxscore, player)
+                if result:
+                    updates.append(result)
         
         # Update Google Sheets
         if updates:
-            self._update_sheets(sheet_name, updates)
+            if pending_ranges is not None:
+                pending_ranges.extend(self._build_update_ranges(sheet_name, updates))
+            else:
+                self._update_sheets(sheet_name, updates)
         
         return len(updates)
 
-    def _update_sheets(self, sheet_name: str, updates: List[Dict[str, Any]]):
+    def _build_update_ranges(self, sheet_name: str, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Group consecutive rows into single H:I ranges for values.batchUpdate"""
+        value_ranges = []
+        run = []
+        
+        for update in sorted(updates, key=lambda u: u['row']):
+            if run and update['row'] != run[-1]['row'] + 1:
+                value_ranges.append(self._run_to_range(sheet_name, run))
+                run = []
+            run.append(update)
+        
+        if run:
+            value_ranges.append(self._run_to_range(sheet_name, run))
+        
+        return value_ranges
+
+    def _run_to_range(self, sheet_name: str, run: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # None leaves the Over/Under cell untouched when there is no line to compare against
+        return {
+            'range': f"'{sheet_name}'!H{run[0]['row']}:I{run[-1]['row']}",
+            'values': [[update['actual'], update['over_under'] or None] for update in run]
+        }
+
+    def _batch_update_values(self, data: List[Dict[str, Any]]) -> bool:
         try:
-            # Update Actual column (H)
-            actual_updates = []
-            over_under_updates = []
-            
-            for update in updates:
-                actual_updates.append({
-                    'range': f"'{sheet_name}'!H{update['row']}",
-                    'values': [[update['actual']]]
-                })
-                
-                if update['over_under']:
-                    over_under_updates.append({
-                        'range': f"'{sheet_name}'!I{update['row']}",
-                        'values': [[update['over_under']]]
-                    })
-            
-            # Batch update
             body = {
                 'valueInputOption': 'RAW',
-                'data': actual_updates + over_under_updates
+                'data': data
             }
             
-            self.sheets_service.spreadsheets().values().batchUpdate(
+            self._execute(self.sheets_service.spreadsheets().values().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body=body
-            ).execute()
-            
-            cprint(f"Updated {len(updates)} players in {sheet_name}", "green")
+            ))
+            return True
             
         except Exception as e:
             cprint(f"Error updating sheets: {e}", "red")
+            return False
+
+    def _update_sheets(self, sheet_name: str, updates: List[Dict[str, Any]]):
+        if self._batch_update_values(self._build_update_ranges(sheet_name, updates)):
+            cprint(f"Updated {len(updates)} players in {sheet_name}", "green")
 
     def fetch_all_actual_results(self):
         if not self.sheets_service:
@@ -460,30 +651,38 @@ class ActualResultsFetcher:
             return
         
         sheet_names = self.get_all_sheets()
+        sheets_values = self.read_all_sheet_values(sheet_names)
+        pending_ranges = []
         total_updates = 0
         
         for sheet_name in sheet_names:
             cprint(f"\nProcessing sheet: {sheet_name}", "cyan", attrs=["bold"])
-            players = self.read_sheet_data(sheet_name)
+            values = sheets_values.get(sheet_name)
             
-            if not players:
+            if not values:
                 cprint(f"No players found in {sheet_name}", "yellow")
                 continue
             
-            updates = self.update_actual_results(sheet_name, players)
+            # Rows are parsed lazily as update_actual_results walks them
+            players = self.iter_sheet_rows(sheet_name, values)
+            updates = self.update_actual_results(sheet_name, players, pending_ranges)
             total_updates += updates
-            cprint(f"Updated {updates} players in {sheet_name}", "green")
-            
-            # Small delay between sheets
-            time.sleep(1)
+            cprint(f"Found {updates} results in {sheet_name}", "green")
+        
+        # Write every sheet's results in a single batchUpdate
+        if pending_ranges and not self._batch_update_values(pending_ranges):
+            total_updates = 0
         
         cprint(f"\nTotal updates across all sheets: {total_updates}", "green", attrs=["bold"])
 
-def main():
+def main(sheets_service=None):
     spreadsheet_id = "1H9HcjtjoG9AlRJ3lAvgZXpefYfuVcylwqc4D4B_Ai1g"
     
-    fetcher = ActualResultsFetcher(spreadsheet_id)
-    fetcher.fetch_all_actual_results()
+    fetcher = ActualResultsFetcher(spreadsheet_id, sheets_service=sheets_service)
+    try:
+        fetcher.fetch_all_actual_results()
+    finally:
+        fetcher.close()
 
 if __name__ == "__main__":
     main()
@@ -2,217 +2,268 @@
 
 import sys
 import os
-from typing import Optional
-from termcolor import cprint
+import functools
+import importlib
+from termcolor import colored, cprint
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows has no termios; prompts fall back to line input
+    termios = None
+
+# Make the helper scripts under utils/ and tests/ importable, relative to this file
+_HERE = os.path.dirname(os.path.abspath(__file__))
+for _sub in ("utils", "tests"):
+    _path = os.path.join(_HERE, _sub)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+SPREADSHEET_ID = "1H9HcjtjoG9AlRJ3lAvgZXpefYfuVcylwqc4D4B_Ai1g"
+
+# Google Sheets service shared by every menu action in this session
+_SHEETS_SERVICE_CACHE = None
+
+def get_sheets_service():
+    """Build the Google Sheets service once and reuse it across menu actions"""
+    global _SHEETS_SERVICE_CACHE
+    if _SHEETS_SERVICE_CACHE is None:
+        try:
+            from google.oauth2 import service_account
+            from googleapiclient.discovery import build
+            credentials = service_account.Credentials.from_service_account_file(
+                'service-account-key.json', scopes=['https://www.googleapis.com/auth/spreadsheets'])
+            _SHEETS_SERVICE_CACHE = build('sheets', 'v4', credentials=credentials,
+                                          cache_discovery=False, static_discovery=True)
+        except Exception as e:
+            cprint(f"Error setting up Google Sheets: {e}", "red")
+    return _SHEETS_SERVICE_CACHE
+
+def _cached_import(name):
+    """Return an imported module from sys.modules, importing it on first use"""
+    module = sys.modules.get(name)
+    if module is None:
+        # import_module leaves nothing cached when the import fails, so a later call can retry
+        module = importlib.import_module(name)
+    return module
+
+# Stat types offered for scraping and analysis
+_STAT_TYPES = (
+    "Pass Yards",
+    "Rush Yards",
+    "Pass TDs",
+    "Receiving Yards",
+    "FG Made",
+    "Receptions",
+    "Rush+Rec Yds",
+    "Rush+Rec TDs",
+    "Fantasy Score",
+    "Pass Attempts",
+    "Rec Targets",
+    "Sacks",
+    "Pass Completions",
+    "INT",
+    "Pass+Rush Yds",
+    "Rush Attempts",
+    "Kicking Points",
+    "Tackles+Ast",
+)
+
+_BAR50 = "=" * 50
+_BAR60 = "=" * 60
+
+def _render_menu(title, options, bar=_BAR50):
+    """Pre-color a menu so it can be written to stdout in one call"""
+    bar = colored(bar, "cyan")
+    lines = ["", bar, colored(title, "yellow", attrs=["bold"]), bar]
+    lines.extend(colored(option, "white") for option in options)
+    lines.append(bar)
+    return "\n".join(lines) + "\n"
+
+_MAIN_MENU = _render_menu("🤖 PrizePicks Bot", (
+    "1. 📊 Scrape Stats",
+    "2. 📈 Fetch Game Stats",
+    "3. ⏰ Game Monitor (Sequential: PrizePicks → Underdog)",
+    "4. 📈 Results Analyzer",
+    "5. 🧪 Testing Tools",
+    "6. 🛠️  Maintenance Tools",
+    "7. ❌ Exit",
+), bar=_BAR60)
 
 def show_menu():
     """Display the main menu options"""
-    cprint("\n" + "="*60, "cyan")
-    cprint("🤖 PrizePicks Bot", "yellow", attrs=["bold"])
-    cprint("="*60, "cyan")
-    cprint("1. 📊 Scrape Stats", "white")
-    cprint("2. 📈 Fetch Game Stats", "white")
-    cprint("3. ⏰ Game Monitor (Sequential: PrizePicks → Underdog)", "white")
-    cprint("4. 📈 Results Analyzer", "white")
-    cprint("5. 🧪 Testing Tools", "white")
-    cprint("6. 🛠️  Maintenance Tools", "white")
-    cprint("7. ❌ Exit", "white")
-    cprint("="*60, "cyan")
+    sys.stdout.write(_MAIN_MENU)
+    sys.stdout.flush()
+
+_SCRAPING_MENU = _render_menu("📊 Scrape Stats", (
+    "1. 🎯 PrizePicks",
+    "2. 🐕 Underdog Fantasy",
+    "3. ⬅️  Back to Main Menu",
+))
 
 def show_scraping_menu():
     """Display scraping options menu"""
-    cprint("\n" + "="*50, "cyan")
-    cprint("📊 Scrape Stats", "yellow", attrs=["bold"])
-    cprint("="*50, "cyan")
-    cprint("1. 🎯 PrizePicks", "white")
-    cprint("2. 🐕 Underdog Fantasy", "white")
-    cprint("3. ⬅️  Back to Main Menu", "white")
-    cprint("="*50, "cyan")
+    sys.stdout.write(_SCRAPING_MENU)
+    sys.stdout.flush()
+
+_TESTING_MENU = _render_menu("🧪 Testing Tools", (
+    "1. ⚡ Quick Test (Connection & Components)",
+    "2. 🎭 Mock Mode Test (Simulate Results)",
+    "3. 📊 Comprehensive Test (All Features)",
+    "4. ⬅️  Back to Main Menu",
+))
 
 def show_testing_menu():
     """Display testing tools menu"""
-    cprint("\n" + "="*50, "cyan")
-    cprint("🧪 Testing Tools", "yellow", attrs=["bold"])
-    cprint("="*50, "cyan")
-    cprint("1. ⚡ Quick Test (Connection & Components)", "white")
-    cprint("2. 🎭 Mock Mode Test (Simulate Results)", "white")
-    cprint("3. 📊 Comprehensive Test (All Features)", "white")
-    cprint("4. ⬅️  Back to Main Menu", "white")
-    cprint("="*50, "cyan")
+    sys.stdout.write(_TESTING_MENU)
+    sys.stdout.flush()
+
+_RESULTS_ANALYZER_MENU = _render_menu("📈 Results Analyzer", (
+    "1. 📈 Quick Summary Report",
+    "2. 🏆 Best Performers Report",
+    "3. 🎯 Analyze by Stat Type",
+    "4. ⬅️  Back to Main Menu",
+))
 
 def show_results_analyzer_menu():
     """Display results analyzer menu"""
-    cprint("\n" + "="*50, "cyan")
-    cprint("📈 Results Analyzer", "yellow", attrs=["bold"])
-    cprint("="*50, "cyan")
-    cprint("1. 📈 Quick Summary Report", "white")
-    cprint("2. 🏆 Best Performers Report", "white")
-    cprint("3. 🎯 Analyze by Stat Type", "white")
-    cprint("4. ⬅️  Back to Main Menu", "white")
-    cprint("="*50, "cyan")
+    sys.stdout.write(_RESULTS_ANALYZER_MENU)
+    sys.stdout.flush()
 
 def get_all_stat_types():
     """Get all available stat types for analysis"""
-    return [
-        "Pass Yards",
-        "Rush Yards", 
-        "Pass TDs",
-        "Receiving Yards",
-        "FG Made",
-        "Receptions",
-        "Rush+Rec Yds",
-        "Rush+Rec TDs",
-        "Fantasy Score",
-        "Pass Attempts",
-        "Rec Targets",
-        "Sacks",
-        "Pass Completions",
-        "INT",
-        "Pass+Rush Yds",
-        "Rush Attempts",
-        "Kicking Points",
-        "Tackles+Ast"
-    ]
-
-def display_stat_type_menu():
-    """Display stat type selection menu"""
-    stat_types = get_all_stat_types()
-    
-    cprint("\n" + "="*50, "cyan")
-    cprint("📊 STAT TYPE SELECTION", "yellow", attrs=["bold"])
-    cprint("="*50, "cyan")
-    cprint("Select which stat type you want to analyze:", "white")
-    print()
-    
-    for i, stat_type in enumerate(stat_types, 1):
-        cprint(f"{i:2d}) {stat_type}", "white")
-    
-    cprint(f"{len(stat_types) + 1:2d}) All Stats", "green")
-    print()
-    
-    return stat_types
+    return _STAT_TYPES
 
-def get_stat_type_selection():
-    """Get and validate stat type selection from menu"""
-    stat_types = display_stat_type_menu()
-    
-    while True:
-        try:
-            choice = input("Enter your choice (1-{}): ".format(len(stat_types) + 1)).strip()
-            
-            if not choice:
-                cprint("Please enter a valid choice.", "red")
-                continue
-                
-            choice_num = int(choice)
-            
-            if choice_num == len(stat_types) + 1:
-                return stat_types  # All stats
-            elif 1 <= choice_num <= len(stat_types):
-                return [stat_types[choice_num - 1]]  # Single stat type
-            else:
-                cprint(f"Please enter a number between 1 and {len(stat_types) + 1}", "red")
-                
-        except ValueError:
-            cprint("Please enter a valid number.", "red")
-        except KeyboardInterrupt:
-            cprint("\n👋 Analysis cancelled", "yellow")
-            return None
+def _prompt(message):
+    """Write a prompt through the same buffered stdout as the menus and read the stripped answer"""
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("stdin closed")
+    return line.strip()
 
-def get_underdog_stat_type_selection():
-    """Get and validate Underdog stat type selection from menu"""
-    # Import the STAT_TYPES from visit_underdog
+def _read_key(message):
+    """Prompt for a single keystroke, falling back to a full line when stdin is not a terminal"""
+    if termios is None or not sys.stdin.isatty():
+        return _prompt(message)
+    
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
     try:
-        import visit_underdog
-        stat_types = visit_underdog.STAT_TYPES
-    except ImportError:
-        cprint("Error importing Underdog stat types", "red")
-        return None
+        tty.setcbreak(fd)
+        key = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     
-    cprint("\n" + "="*50, "cyan")
-    cprint("UNDERDOG FANTASY - STAT TYPE SELECTION", "yellow", attrs=["bold"])
-    cprint("="*50, "cyan")
-    cprint("Select which prop type you want to scrape:", "white")
+    # cbreak mode disables echo, so show the key that was pressed
+    sys.stdout.write(key + "\n")
+    sys.stdout.flush()
+    return key.strip()
+
+# Static prompt feedback, colored once at import
+_MSG_ENTER_CHOICE = colored("Please enter a valid choice.", "red")
+_MSG_ENTER_NUMBER = colored("Please enter a valid number.", "red")
+_MSG_ENTER_YES_NO = colored("Please enter 'y' for yes or 'n' for no.", "red")
+_MSG_INVALID_1_3 = colored("❌ Invalid choice. Please select 1-3.", "red")
+_MSG_INVALID_1_4 = colored("❌ Invalid choice. Please select 1-4.", "red")
+_MSG_INVALID_1_7 = colored("❌ Invalid choice. Please select 1-7.", "red")
+
+# Menu answers mapped straight to their number; anything else is not a valid choice
+_CHOICE_TABLE = {str(i): i for i in range(1, 100)}
+
+def _choose_from(title, subtitle, items, cancel_label):
+    """Show a numbered menu of items plus "All Stats" and return the selection"""
+    cprint("\n" + _BAR50, "cyan")
+    cprint(title, "yellow", attrs=["bold"])
+    cprint(_BAR50, "cyan")
+    cprint(subtitle, "white")
     print()
     
-    for i, stat_type in enumerate(stat_types, 1):
-        cprint(f"{i:2d}) {stat_type}", "white")
+    for i, item in enumerate(items, 1):
+        cprint(f"{i:2d}) {item}", "white")
     
-    cprint(f"{len(stat_types) + 1:2d}) All Stats", "green")
+    cprint(f"{len(items) + 1:2d}) All Stats", "green")
     print()
     
     while True:
         try:
-            choice = input("Enter your choice (1-{}): ".format(len(stat_types) + 1)).strip()
+            choice = _prompt("Enter your choice (1-{}): ".format(len(items) + 1))
             
             if not choice:
-                cprint("Please enter a valid choice.", "red")
+                print(_MSG_ENTER_CHOICE)
                 continue
                 
-            choice_num = int(choice)
+            choice_num = _CHOICE_TABLE.get(choice)
+            if choice_num is None:
+                print(_MSG_ENTER_NUMBER)
+                continue
             
-            if choice_num == len(stat_types) + 1:
-                return stat_types  # All stats
-            elif 1 <= choice_num <= len(stat_types):
-                return [stat_types[choice_num - 1]]  # Single stat type
+            if choice_num == len(items) + 1:
+                return list(items)  # All stats
+            elif choice_num <= len(items):
+                return [items[choice_num - 1]]  # Single stat type
             else:
-                cprint(f"Please enter a number between 1 and {len(stat_types) + 1}", "red")
+                cprint(f"Please enter a number between 1 and {len(items) + 1}", "red")
                 
-        except ValueError:
-            cprint("Please enter a valid number.", "red")
         except KeyboardInterrupt:
-            cprint("\n👋 Scraping cancelled", "yellow")
+            cprint(f"\n👋 {cancel_label} cancelled", "yellow")
             return None
 
-def ask_time_filtering_prizepicks():
-    """Ask if user wants to use time-based filtering for PrizePicks"""
+def _yes_no(prompt, cancel_label="Scraping"):
+    """Ask a y/n question, treating Ctrl+C as no"""
     while True:
         try:
-            response = input("\nUse time-based filtering for PrizePicks (only scrape next game time)? (y/n): ").strip().lower()
+            # Only the first character matters, so "y"/"yes" and "n"/"no" all work
+            answer = _read_key(prompt)[:1].lower()
             
-            if response in ['y', 'yes']:
+            if answer == 'y':
                 return True
-            elif response in ['n', 'no']:
+            elif answer == 'n':
                 return False
             else:
-                cprint("Please enter 'y' for yes or 'n' for no.", "red")
+                print(_MSG_ENTER_YES_NO)
                 
         except KeyboardInterrupt:
-            cprint("\n👋 Scraping cancelled", "yellow")
+            cprint(f"\n👋 {cancel_label} cancelled", "yellow")
             return False
 
-def ask_time_filtering_underdog():
-    """Ask if user wants to use time-based filtering for Underdog"""
-    while True:
-        try:
-            response = input("\nUse time-based filtering for Underdog (only scrape next game time)? (y/n): ").strip().lower()
-            
-            if response in ['y', 'yes']:
-                return True
-            elif response in ['n', 'no']:
-                return False
-            else:
-                cprint("Please enter 'y' for yes or 'n' for no.", "red")
-                
-        except KeyboardInterrupt:
-            cprint("\n👋 Scraping cancelled", "yellow")
-            return False
+def get_stat_type_selection():
+    """Get and validate stat type selection from menu"""
+    return _choose_from("📊 STAT TYPE SELECTION", "Select which stat type you want to analyze:",
+                        get_all_stat_types(), "Analysis")
+
+def get_underdog_stat_type_selection():
+    """Get and validate Underdog stat type selection from menu"""
+    # Import the STAT_TYPES from visit_underdog
+    try:
+        visit_underdog = _cached_import("visit_underdog")
+        stat_types = visit_underdog.STAT_TYPES
+    except ImportError:
+        cprint("Error importing Underdog stat types", "red")
+        return None
+    
+    return _choose_from("UNDERDOG FANTASY - STAT TYPE SELECTION", "Select which prop type you want to scrape:",
+                        stat_types, "Scraping")
+
+_MAINTENANCE_MENU = _render_menu("🛠️  Maintenance Tools", (
+    "1. 📦 Install Dependencies",
+    "2. 🖱️  Mouse Coordinates Tracker",
+    "3. ⬅️  Back to Main Menu",
+))
 
 def show_maintenance_menu():
     """Display maintenance tools menu"""
-    cprint("\n" + "="*50, "cyan")
-    cprint("🛠️  Maintenance Tools", "yellow", attrs=["bold"])
-    cprint("="*50, "cyan")
-    cprint("1. 📦 Install Dependencies", "white")
-    cprint("2. 🖱️  Mouse Coordinates Tracker", "white")
-    cprint("3. ⬅️  Back to Main Menu", "white")
-    cprint("="*50, "cyan")
+    sys.stdout.write(_MAINTENANCE_MENU)
+    sys.stdout.flush()
 
 def run_prizepicks_scraper():
     """Run the PrizePicks scraper"""
     try:
         cprint("\n🎯 Starting PrizePicks Scraper...", "green", attrs=["bold"])
-        import visit_prizepicks
+        visit_prizepicks = _cached_import("visit_prizepicks")
         
         # Get stat type selection from user
         selected_stat_types = get_stat_type_selection()
@@ -220,7 +271,7 @@ def run_prizepicks_scraper():
             return False
         
         # Ask about time filtering
-        use_time_filtering = ask_time_filtering_prizepicks()
+        use_time_filtering = _yes_no("\nUse time-based filtering for PrizePicks (only scrape next game time)? (y/n): ")
         
         # Run non-interactive scraping
         success = visit_prizepicks.run_non_interactive_scraping(selected_stat_types, use_time_filtering)
@@ -237,7 +288,7 @@ def run_underdog_scraper():
     """Run the Underdog Fantasy scraper"""
     try:
         cprint("\n🐕 Starting Underdog Fantasy Scraper...", "green", attrs=["bold"])
-        import visit_underdog
+        visit_underdog = _cached_import("visit_underdog")
         
         # Get stat type selection from user
         selected_stat_types = get_underdog_stat_type_selection()
@@ -245,7 +296,7 @@ def run_underdog_scraper():
             return False
         
         # Ask about time filtering
-        use_time_filtering = ask_time_filtering_underdog()
+        use_time_filtering = _yes_no("\nUse time-based filtering for Underdog (only scrape next game time)? (y/n): ")
         
         # Run non-interactive scraping
         success = visit_underdog.run_non_interactive_scraping(selected_stat_types, use_time_filtering)
@@ -263,8 +314,12 @@ def run_results_fetcher():
     try:
         cprint("\n📊 Starting NFL Stats Fetcher...", "green", attrs=["bold"])
         cprint("Using nfl_data_py for official NFL statistics", "cyan")
-        import nfl_stats_fetcher
-        nfl_stats_fetcher.main()
+        nfl_stats_fetcher = _cached_import("nfl_stats_fetcher")
+        nfl_stats_fetcher.main(sheets_service=get_sheets_service())
+        
+        # Sheets the analyzer already loaded may now be missing these results
+        if _get_analyzer.cache_info().currsize:
+            _get_analyzer().clear_sheet_cache()
         return True
     except ImportError as e:
         cprint(f"❌ Error importing nfl_stats_fetcher: {e}", "red")
@@ -277,7 +332,7 @@ def run_game_monitor():
     """Run the game monitor"""
     try:
         cprint("\n⏰ Starting Game Monitor...", "green", attrs=["bold"])
-        import monitor
+        monitor = _cached_import("monitor")
         
         # Run monitoring session with sequential scraping (PrizePicks → Underdog)
         monitor.run_monitoring_session(use_sequential_scraping=True, trigger_window_hours=1)
@@ -290,89 +345,48 @@ def run_game_monitor():
         cprint(f"❌ Error running game monitor: {e}", "red")
         return False
 
-def run_install_dependencies():
-    """Run the dependency installer"""
-    try:
-        cprint("\n📦 Installing Dependencies...", "green", attrs=["bold"])
-        sys.path.append('utils')
-        import install_dependencies
-        install_dependencies.main()
-        return True
-    except ImportError as e:
-        cprint(f"❌ Error importing install_dependencies: {e}", "red")
-        return False
-    except Exception as e:
-        cprint(f"❌ Error running dependency installer: {e}", "red")
-        return False
-
-def run_mouse_coordinates():
-    """Run the mouse coordinates tracker"""
-    try:
-        cprint("\n🖱️  Starting Mouse Coordinates Tracker...", "green", attrs=["bold"])
-        cprint("Press Ctrl+C to exit", "yellow")
-        sys.path.append('utils')
-        import mouse_coordinates
-        mouse_coordinates.display_mouse_coordinates()
-        return True
-    except ImportError as e:
-        cprint(f"❌ Error importing mouse_coordinates: {e}", "red")
-        return False
-    except Exception as e:
-        cprint(f"❌ Error running mouse coordinates tracker: {e}", "red")
-        return False
+# Standalone tools: key -> (header, extra note, module, entry function, description)
+_TOOLS = {
+    'install_deps': ("📦 Installing Dependencies...", None,
+                     "install_dependencies", "main", "dependency installer"),
+    'mouse_coords': ("🖱️  Starting Mouse Coordinates Tracker...", "Press Ctrl+C to exit",
+                     "mouse_coordinates", "display_mouse_coordinates", "mouse coordinates tracker"),
+    'quick_test': ("⚡ Starting Quick Test...", None,
+                   "quick_test", "run_quick_tests", "quick test"),
+    'mock_test': ("🎭 Starting Mock Mode Test...", None,
+                  "mock_test_mode", "test_mock_mode", "mock test"),
+    'comprehensive_test': ("📊 Starting Comprehensive Test...", None,
+                           "test_actual_results", "run_comprehensive_test", "comprehensive test"),
+}
 
-def run_quick_test():
-    """Run the quick test"""
+def run_tool(key):
+    """Run one of the standalone tools listed in _TOOLS"""
+    header, note, module_name, function_name, description = _TOOLS[key]
     try:
-        cprint("\n⚡ Starting Quick Test...", "green", attrs=["bold"])
-        sys.path.append('tests')
-        import quick_test
-        quick_test.run_quick_tests()
+        cprint("\n" + header, "green", attrs=["bold"])
+        if note:
+            cprint(note, "yellow")
+        module = _cached_import(module_name)
+        getattr(module, function_name)()
         return True
     except ImportError as e:
-        cprint(f"❌ Error importing quick_test: {e}", "red")
+        cprint(f"❌ Error importing {module_name}: {e}", "red")
         return False
     except Exception as e:
-        cprint(f"❌ Error running quick test: {e}", "red")
+        cprint(f"❌ Error running {description}: {e}", "red")
         return False
 
-def run_mock_test():
-    """Run the mock mode test"""
-    try:
-        cprint("\n🎭 Starting Mock Mode Test...", "green", attrs=["bold"])
-        sys.path.append('tests')
-        import mock_test_mode
-        mock_test_mode.test_mock_mode()
-        return True
-    except ImportError as e:
-        cprint(f"❌ Error importing mock_test_mode: {e}", "red")
-        return False
-    except Exception as e:
-        cprint(f"❌ Error running mock test: {e}", "red")
-        return False
-
-def run_comprehensive_test():
-    """Run the comprehensive test"""
-    try:
-        cprint("\n📊 Starting Comprehensive Test...", "green", attrs=["bold"])
-        sys.path.append('tests')
-        import test_actual_results
-        test_actual_results.run_comprehensive_test()
-        return True
-    except ImportError as e:
-        cprint(f"❌ Error importing test_actual_results: {e}", "red")
-        return False
-    except Exception as e:
-        cprint(f"❌ Error running comprehensive test: {e}", "red")
-        return False
+@functools.lru_cache(maxsize=1)
+def _get_analyzer():
+    """Build the results analyzer once so its loaded sheets survive between reports"""
+    results_analyzer = _cached_import("results_analyzer")
+    return results_analyzer.ResultsAnalyzer(SPREADSHEET_ID, service=get_sheets_service())
 
 def run_results_analyzer():
     """Run the results analyzer"""
     try:
         cprint("\n📈 Starting Results Analyzer...", "green", attrs=["bold"])
-        import results_analyzer
-        analyzer = results_analyzer.ResultsAnalyzer("1H9HcjtjoG9AlRJ3lAvgZXpefYfuVcylwqc4D4B_Ai1g")
-        return analyzer
+        return _get_analyzer()
     except ImportError as e:
         cprint(f"❌ Error importing results_analyzer: {e}", "red")
         return None
@@ -407,7 +421,7 @@ def run_best_performers():
         return False
     
     try:
-        sheet_name = input("\nEnter sheet name for best performers report: ").strip()
+        sheet_name = _prompt("\nEnter sheet name for best performers report: ")
         if not sheet_name:
             cprint("❌ Sheet name cannot be empty", "red")
             return False
@@ -460,43 +474,29 @@ def run_analyze_by_stat_type():
         # Filter data by selected stat types
         if len(selected_stats) == 1 and selected_stats[0] != "All Stats":
             # Single stat type - filter the data
-            filtered_data = [bet for bet in analyzer.data if bet['stat_type'] == selected_stats[0]]
+            filtered_data = analyzer.bets_for_stat_type(selected_stats[0])
             if not filtered_data:
                 cprint(f"❌ No data found for stat type: {selected_stats[0]}", "red")
                 return False
             
-            # Temporarily replace analyzer.data with filtered data
-            original_data = analyzer.data
-            analyzer.data = filtered_data
-            
             cprint(f"📊 Found {len(filtered_data)} bets for {selected_stats[0]}", "cyan")
             
-            # Calculate and display ratios
-            ratios = analyzer.calculate_over_under_ratios()
-            analyzer.display_summary_report(ratios)
-            analyzer.display_stat_type_ratios(ratios['by_stat_type'])
-            analyzer.display_player_ratios(ratios['by_player'])
-            analyzer.display_team_ratios(ratios['by_team'])
-            analyzer.display_position_ratios(ratios['by_position'])
-            
-            # Restore original data
-            analyzer.data = original_data
-            
+            # Aggregate only the selected stat's bets
+            ratios = analyzer.calculate_over_under_ratios(filtered_data)
         else:
-            # All stats or multiple stats - show full analysis
+            # All stats or multiple stats - aggregate once, then narrow the stat type view
             ratios = analyzer.calculate_over_under_ratios()
             
             if len(selected_stats) > 1:
-                # Multiple specific stats - filter the display
-                filtered_stat_ratios = {stat: data for stat, data in ratios['by_stat_type'].items() 
-                                      if stat in selected_stats}
-                ratios['by_stat_type'] = filtered_stat_ratios
-            
-            analyzer.display_summary_report(ratios)
-            analyzer.display_stat_type_ratios(ratios['by_stat_type'])
-            analyzer.display_player_ratios(ratios['by_player'])
-            analyzer.display_team_ratios(ratios['by_team'])
-            analyzer.display_position_ratios(ratios['by_position'])
+                wanted = frozenset(selected_stats)
+                ratios['by_stat_type'] = {stat: data for stat, data in ratios['by_stat_type'].items()
+                                          if stat in wanted}
+        
+        analyzer.display_summary_report(ratios)
+        analyzer.display_stat_type_ratios(ratios['by_stat_type'])
+        analyzer.display_player_ratios(ratios['by_player'])
+        analyzer.display_team_ratios(ratios['by_team'])
+        analyzer.display_position_ratios(ratios['by_position'])
         
         return True
         
@@ -507,97 +507,100 @@ def run_analyze_by_stat_type():
         cprint(f"❌ Error analyzing by stat type: {e}", "red")
         return False
 
+def run_prizepicks_from_menu():
+    """Run the PrizePicks scraper and report the outcome"""
+    if run_prizepicks_scraper():
+        cprint("✅ PrizePicks scraping completed successfully!", "green")
+    else:
+        cprint("❌ PrizePicks scraping failed or was cancelled", "red")
+
+def run_underdog_from_menu():
+    """Run the Underdog Fantasy scraper and report the outcome"""
+    if run_underdog_scraper():
+        cprint("✅ Underdog Fantasy scraping completed successfully!", "green")
+    else:
+        cprint("❌ Underdog Fantasy scraping failed or was cancelled", "red")
+
+def run_submenu(show, prompt, actions, back_choice, invalid_message):
+    """Show a submenu until its back option is chosen, dispatching other choices through actions"""
+    # Bound once as locals so the loop avoids repeated global/attribute lookups
+    read_choice = _read_key
+    get_action = actions.get
+    while True:
+        show()
+        choice = read_choice(prompt)
+        action = get_action(choice)
+        
+        if action is not None:
+            action()
+        elif choice == back_choice:
+            break
+        else:
+            print(invalid_message)
+
+# Submenu choice -> handler; each submenu's back option is handled by run_submenu
+_SCRAPING_ACTIONS = {
+    '1': run_prizepicks_from_menu,
+    '2': run_underdog_from_menu,
+}
+
+_ANALYZER_ACTIONS = {
+    '1': run_quick_summary,
+    '2': run_best_performers,
+    '3': run_analyze_by_stat_type,
+}
+
+_TESTING_ACTIONS = {
+    '1': functools.partial(run_tool, 'quick_test'),
+    '2': functools.partial(run_tool, 'mock_test'),
+    '3': functools.partial(run_tool, 'comprehensive_test'),
+}
+
+_MAINTENANCE_ACTIONS = {
+    '1': functools.partial(run_tool, 'install_deps'),
+    '2': functools.partial(run_tool, 'mouse_coords'),
+}
+
+# Main menu choice -> handler; option 7 exits
+_MAIN_ACTIONS = {
+    '1': lambda: run_submenu(show_scraping_menu, "\nSelect scraping option (1-3): ",
+                             _SCRAPING_ACTIONS, '3', _MSG_INVALID_1_3),
+    '2': run_results_fetcher,
+    '3': run_game_monitor,
+    '4': lambda: run_submenu(show_results_analyzer_menu, "\nSelect analyzer option (1-4): ",
+                             _ANALYZER_ACTIONS, '4', _MSG_INVALID_1_4),
+    '5': lambda: run_submenu(show_testing_menu, "\nSelect testing option (1-4): ",
+                             _TESTING_ACTIONS, '4', _MSG_INVALID_1_4),
+    '6': lambda: run_submenu(show_maintenance_menu, "\nSelect maintenance option (1-3): ",
+                             _MAINTENANCE_ACTIONS, '3', _MSG_INVALID_1_3),
+}
+
 def main():
     """Main application entry point"""
+    # Bound once as locals so the loop avoids repeated global/attribute lookups
+    local_cprint = cprint
+    read_choice = _read_key
+    get_action = _MAIN_ACTIONS.get
     while True:
         show_menu()
         
         try:
-            choice = input("\nSelect an option (1-7): ").strip()
+            choice = read_choice("\nSelect an option (1-7): ")
+            action = get_action(choice)
             
-            if choice == '1':
-                # Scraping submenu
-                while True:
-                    show_scraping_menu()
-                    scraping_choice = input("\nSelect scraping option (1-3): ").strip()
-                    
-                    if scraping_choice == '1':
-                        success = run_prizepicks_scraper()
-                        if success:
-                            cprint("✅ PrizePicks scraping completed successfully!", "green")
-                        else:
-                            cprint("❌ PrizePicks scraping failed or was cancelled", "red")
-                    elif scraping_choice == '2':
-                        success = run_underdog_scraper()
-                        if success:
-                            cprint("✅ Underdog Fantasy scraping completed successfully!", "green")
-                        else:
-                            cprint("❌ Underdog Fantasy scraping failed or was cancelled", "red")
-                    elif scraping_choice == '3':
-                        break
-                    else:
-                        cprint("❌ Invalid choice. Please select 1-3.", "red")
-            elif choice == '2':
-                run_results_fetcher()
-            elif choice == '3':
-                run_game_monitor()
-            elif choice == '4':
-                # Results analyzer submenu
-                while True:
-                    show_results_analyzer_menu()
-                    analyzer_choice = input("\nSelect analyzer option (1-4): ").strip()
-                    
-                    if analyzer_choice == '1':
-                        run_quick_summary()
-                    elif analyzer_choice == '2':
-                        run_best_performers()
-                    elif analyzer_choice == '3':
-                        run_analyze_by_stat_type()
-                    elif analyzer_choice == '4':
-                        break
-                    else:
-                        cprint("❌ Invalid choice. Please select 1-4.", "red")
-            elif choice == '5':
-                # Testing submenu
-                while True:
-                    show_testing_menu()
-                    test_choice = input("\nSelect testing option (1-4): ").strip()
-                    
-                    if test_choice == '1':
-                        run_quick_test()
-                    elif test_choice == '2':
-                        run_mock_test()
-                    elif test_choice == '3':
-                        run_comprehensive_test()
-                    elif test_choice == '4':
-                        break
-                    else:
-                        cprint("❌ Invalid choice. Please select 1-4.", "red")
-            elif choice == '6':
-                # Maintenance submenu
-                while True:
-                    show_maintenance_menu()
-                    maint_choice = input("\nSelect maintenance option (1-3): ").strip()
-                    
-                    if maint_choice == '1':
-                        run_install_dependencies()
-                    elif maint_choice == '2':
-                        run_mouse_coordinates()
-                    elif maint_choice == '3':
-                        break
-                    else:
-                        cprint("❌ Invalid choice. Please select 1-3.", "red")
+            if action is not None:
+                action()
             elif choice == '7':
-                cprint("\n👋 Goodbye!", "green", attrs=["bold"])
+                local_cprint("\n👋 Goodbye!", "green", attrs=["bold"])
                 break
             else:
-                cprint("❌ Invalid choice. Please select 1-7.", "red")
+                print(_MSG_INVALID_1_7)
                 
         except KeyboardInterrupt:
-            cprint("\n\n👋 Goodbye!", "green", attrs=["bold"])
+            local_cprint("\n\n👋 Goodbye!", "green", attrs=["bold"])
             break
         except Exception as e:
-            cprint(f"❌ Unexpected error: {e}", "red")
+            local_cprint(f"❌ Unexpected error: {e}", "red")
 
 if __name__ == "__main__":
     main()
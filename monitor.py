@@ -1,280 +1,331 @@
 #!/usr/bin/env python3
 
 from datetime import datetime, timedelta
+import importlib
+import io
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from termcolor import cprint
+from termcolor import colored, cprint
 import nfl_data_py as nfl
+import numpy as np
 import pandas as pd
 import pytz
 
-def parse_game_time(game_time_str):
+# Game times as PrizePicks shows them, e.g. "Thu 7:20pm"
+_GAME_TIME_RE = re.compile(r'(?P<day>[A-Za-z]{3})\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?P<ampm>[AaPp])[Mm]', re.ASCII)
+
+# Hours added to the 12-hour clock value (hour % 12) for am/pm
+_HOUR_SHIFT = {'a': 0, 'A': 0, 'p': 12, 'P': 12}
+
+# Day abbreviations to weekday numbers (0=Monday, 6=Sunday)
+_DAY_MAP = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+
+# Schedule kickoffs are published in Eastern Time and shown in local (Central) time
+_EASTERN = pytz.timezone('US/Eastern')
+_CENTRAL = pytz.timezone('US/Central')
+
+# Triggered kickoffs remembered by a long-running monitor (oldest are forgotten first)
+TRIGGERED_HISTORY = 1024
+
+# How long a downloaded schedule is reused before nfl-data-py is asked again (seconds)
+SCHEDULE_TTL = 6 * 60 * 60
+
+# Last downloaded schedule and the games processed from it
+_SCHEDULE_CACHE = {'df': None, 'fetched_at': 0.0, 'table': None, 'games_df': None}
+
+# Per-game fields stored as GamesTable columns, besides the kickoff itself
+_GAME_FIELDS = ('home_team', 'away_team', 'game_time_str', 'season', 'game_type', 'week', 'gameday', 'weekday', 'gametime')
+
+_EPOCH = pd.Timestamp(0, tz='UTC')
+
+def _epoch_ns(moment):
+    """Nanoseconds since the Unix epoch for a tz-aware datetime or Timestamp"""
+    return pd.Timestamp(moment).value
+
+@dataclass
+class GamesTable:
+    """Upcoming games as parallel columns sorted by kickoff; rows become dicts only when returned"""
+    kickoff_ns: np.ndarray
+    kickoff: np.ndarray
+    columns: Dict[str, np.ndarray]
+    
+    @classmethod
+    def from_games(cls, all_games):
+        """Build a table from game dicts shaped like get_nfl_schedule_2025's"""
+        kickoff = np.array([game['game_date'] for game in all_games], dtype=object)
+        kickoff_ns = np.array([_epoch_ns(moment) for moment in kickoff], dtype=np.int64)
+        order = np.argsort(kickoff_ns, kind='stable')
+        columns = {
+            field: np.array([game.get(field, 'Unknown') for game in all_games], dtype=object)[order]
+            for field in _GAME_FIELDS
+        }
+        return cls(kickoff_ns[order], kickoff[order], columns)
+    
+    def __len__(self):
+        return len(self.kickoff_ns)
+    
+    def index_after(self, moment):
+        """Position of the first kickoff strictly after moment"""
+        return int(np.searchsorted(self.kickoff_ns, _epoch_ns(moment), side='right'))
+    
+    def index_from(self, moment):
+        """Position of the first kickoff at or after moment"""
+        return int(np.searchsorted(self.kickoff_ns, _epoch_ns(moment), side='left'))
+    
+    def slot_end(self, start):
+        """Position just past the last game sharing the kickoff at start"""
+        return int(np.searchsorted(self.kickoff_ns, self.kickoff_ns[start], side='right'))
+    
+    def rows(self, start=0, stop=None):
+        """Game dicts for positions start..stop, as returned by get_nfl_schedule_2025"""
+        stop = len(self) if stop is None else stop
+        columns = self.columns
+        return [{
+            'home_team': columns['home_team'][i],
+            'away_team': columns['away_team'][i],
+            'game_date': self.kickoff[i],
+            'game_time_str': columns['game_time_str'][i],
+            'season': columns['season'][i],
+            'game_type': columns['game_type'][i],
+            'week': columns['week'][i],
+            'gameday': columns['gameday'][i],
+            'weekday': columns['weekday'][i],
+            'gametime': columns['gametime'][i]
+        } for i in range(start, stop)]
+
+def parse_game_time(game_time_str, now=None):
     """Parse game time string from PrizePicks and return datetime object"""
     if not game_time_str:
         return None
     
+    clock = _parse_game_clock(game_time_str)
+    if clock is None:
+        return None
+    
+    # Only this step depends on the current time; the string itself was parsed once
+    day_num, hour, minute = clock
+    today = now or datetime.now()
+    today_ordinal = today.toordinal()
+    
+    # Find the next occurrence of this day (ordinal 1 is a Monday)
+    days_ahead = _days_until(day_num, (today_ordinal + 6) % 7, hour * 60 + minute, today.hour * 60 + today.minute)
+    return datetime.fromordinal(today_ordinal + days_ahead).replace(hour=hour, minute=minute)
+
+def _days_until(day_num, today_weekday, game_minutes, today_minutes):
+    """Days from today until the next kickoff on day_num, a week out if today's has passed"""
+    # passed is 0 or 1: shifting by it turns a same-day kickoff that has passed into 7
+    passed = game_minutes <= today_minutes
+    return (day_num - today_weekday - passed) % 7 + passed
+
+@lru_cache(maxsize=1024)
+def _parse_game_clock(game_time_str):
+    """Split a game time string into (weekday number, 24-hour hour, minute), or None"""
     try:
         # Handle formats like "Thu 7:20pm", "Fri 8:15pm", "Sun 1:00pm"
         # Extract day and time
-        match = re.match(r'(\w{3})\s+(\d{1,2}):(\d{2})([ap]m)', game_time_str.strip())
+        match = _GAME_TIME_RE.match(game_time_str.strip())
         if not match:
             return None
         
-        day_abbr, hour, minute, ampm = match.groups()
-        
         # Convert to 24-hour format
-        hour = int(hour)
-        minute = int(minute)
-        if ampm.lower() == 'pm' and hour != 12:
-            hour += 12
-        elif ampm.lower() == 'am' and hour == 12:
-            hour = 0
+        hour = int(match.group('hour')) % 12 + _HOUR_SHIFT[match.group('ampm')]
+        minute = int(match.group('minute'))
         
-        # Map day abbreviations to numbers (0=Monday, 6=Sunday)
-        day_map = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
-        day_num = day_map.get(day_abbr.lower())
-        if day_num is None:
+        day_num = _DAY_MAP.get(match.group('day').lower(), -1)
+        if day_num < 0:
             return None
         
-        # Get current date and find the next occurrence of this day
-        today = datetime.now()
-        days_ahead = (day_num - today.weekday()) % 7
-        if days_ahead == 0 and (hour < today.hour or (hour == today.hour and minute <= today.minute)):
-            days_ahead = 7  # Next week
-        
-        game_date = today + timedelta(days=days_ahead)
-        game_datetime = game_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        
-        return game_datetime
+        return day_num, hour, minute
         
     except Exception as e:
         cprint(f"Error parsing game time '{game_time_str}': {e}", "red")
         return None
 
+def _load_schedule_df():
+    """Get the season schedule DataFrame, downloading it at most once per SCHEDULE_TTL"""
+    cached_df = _SCHEDULE_CACHE['df']
+    if cached_df is not None and time.monotonic() - _SCHEDULE_CACHE['fetched_at'] < SCHEDULE_TTL:
+        return cached_df
+    
+    # Try multiple years to find available data
+    years_to_try = [2025, 2024, 2023]
+    schedule_df = None
+    
+    for year in years_to_try:
+        try:
+            schedule_df = nfl.import_schedules([year])
+            if not schedule_df.empty:
+                break
+        except Exception as e:
+            continue
+    
+    # Empty results are not cached so the next call tries again
+    if schedule_df is not None and not schedule_df.empty:
+        _SCHEDULE_CACHE['df'] = schedule_df
+        _SCHEDULE_CACHE['fetched_at'] = time.monotonic()
+    return schedule_df
+
 def get_nfl_schedule_2025():
     """Get NFL schedule using nfl-data-py"""
     try:
-        # Try multiple years to find available data
-        years_to_try = [2025, 2024, 2023]
-        schedule_df = None
-        
-        for year in years_to_try:
-            try:
-                schedule_df = nfl.import_schedules([year])
-                if not schedule_df.empty:
-                    break
-            except Exception as e:
-                continue
+        schedule_df = _load_schedule_df()
         
         if schedule_df is None or schedule_df.empty:
             cprint("❌ No NFL schedule data found for any recent year", "red")
             return []
         
-        all_games = []
-        current_time = datetime.now(pytz.timezone('US/Central'))
+        current_time = pd.Timestamp.now(tz=_CENTRAL)
         
-        upcoming_count = 0
-        for _, game in schedule_df.iterrows():
-            try:
-                # Skip games that don't have complete data
-                # nfl-data-py uses different column names
-                game_date_col = 'gameday' if 'gameday' in schedule_df.columns else 'game_date'
-                home_team_col = 'home_team' if 'home_team' in schedule_df.columns else 'home'
-                away_team_col = 'away_team' if 'away_team' in schedule_df.columns else 'away'
-                
-                if pd.isna(game.get(game_date_col)) or pd.isna(game.get(home_team_col)) or pd.isna(game.get(away_team_col)):
-                    continue
-                
-                # Parse game date and time
-                # Combine gameday and gametime if both are available
-                if 'gametime' in schedule_df.columns and not pd.isna(game.get('gametime')):
-                    # Combine date and time
-                    game_date_str = str(game[game_date_col])
-                    game_time_str_raw = str(game['gametime'])
-                    # Handle different time formats
-                    if ':' in game_time_str_raw:
-                        # Format like "20:00" or "8:00 PM"
-                        # NFL times are in Eastern Time, so we need to parse as ET
-                        combined_datetime = f"{game_date_str} {game_time_str_raw}"
-                        game_datetime = pd.to_datetime(combined_datetime)
-                        
-                        # Convert from Eastern Time to local time
-                        # Create timezone-aware datetime in Eastern Time
-                        et_tz = pytz.timezone('US/Eastern')
-                        game_datetime_et = et_tz.localize(game_datetime)
-                        
-                        # Convert to local timezone
-                        local_tz = pytz.timezone('US/Central')  # CDT
-                        game_datetime = game_datetime_et.astimezone(local_tz)
-                    else:
-                        # Just use the date
-                        game_datetime = pd.to_datetime(game[game_date_col])
-                else:
-                    # Just use the date
-                    game_datetime = pd.to_datetime(game[game_date_col])
-                
-                # Skip past games
-                if game_datetime < current_time:
-                    continue
-                
-                upcoming_count += 1
-                
-                # Get team names and abbreviations
-                home_team = game[home_team_col]
-                away_team = game[away_team_col]
-                
-                # Format game time for display
-                game_time_str = game_datetime.strftime('%a %I:%M%p').lower()
-                
-                
-                # Add single game representation
-                all_games.append({
-                    'home_team': home_team,
-                    'away_team': away_team,
-                    'game_date': game_datetime,
-                    'game_time_str': game_time_str,
-                    'season': game.get('season', 'Unknown'),
-                    'game_type': game.get('game_type', 'Unknown'),
-                    'week': game.get('week', 'Unknown'),
-                    'gameday': game.get('gameday', 'Unknown'),
-                    'weekday': game.get('weekday', 'Unknown'),
-                    'gametime': game.get('gametime', 'Unknown')
-                })
-                
-            except Exception as e:
-                cprint(f"Error processing game: {e}", "red")
-                continue
+        # Same download as last time: reuse its table, dropping any games that have since started
+        if _SCHEDULE_CACHE['games_df'] is schedule_df:
+            table = _SCHEDULE_CACHE['table']
+            return table.rows(table.index_from(current_time))
         
-        return all_games
+        # Resolve columns once against a plain set; nfl-data-py uses different column names
+        columns = set(schedule_df.columns)
+        if 'gametime' not in columns:
+            cprint("❌ NFL schedule data has no game times", "red")
+            return []
+        game_date_col = 'gameday' if 'gameday' in columns else 'game_date'
+        home_team_col = 'home_team' if 'home_team' in columns else 'home'
+        away_team_col = 'away_team' if 'away_team' in columns else 'away'
+        detail_cols = [col for col in ('season', 'game_type', 'week', 'gameday', 'weekday') if col in columns]
+        
+        # Skip games that don't have complete data; a kickoff also needs a clock time to be placed
+        games_df = schedule_df.dropna(subset=[game_date_col, home_team_col, away_team_col])
+        games_df = games_df[games_df['gametime'].notna() & games_df['gametime'].astype(str).str.contains(':', regex=False)]
+        
+        # Parse every kickoff at once: NFL times are in Eastern Time, converted to local (Central) time
+        kickoff_text = games_df[game_date_col].astype(str) + ' ' + games_df['gametime'].astype(str)
+        kickoffs = pd.to_datetime(kickoff_text, format='%Y-%m-%d %H:%M', errors='coerce')
+        unparsed = kickoffs.isna()
+        if unparsed.any():
+            # Anything outside nfl-data-py's usual layout falls back to format inference
+            kickoffs[unparsed] = pd.to_datetime(kickoff_text[unparsed], errors='coerce')
+        kickoffs = kickoffs.dt.tz_localize(_EASTERN, nonexistent='shift_forward', ambiguous='NaT').dt.tz_convert(_CENTRAL)
+        
+        # Skip past games with one mask, then format the display times for the survivors in one pass
+        upcoming = kickoffs >= current_time
+        # Only the columns that reach the game dicts are carried past this point
+        games_df = games_df.loc[upcoming, [home_team_col, away_team_col, 'gametime', *detail_cols]].assign(_kickoff=kickoffs[upcoming])
+        games_df['_time_str'] = games_df['_kickoff'].dt.strftime('%a %I:%M%p').str.lower()
+        
+        # Store the survivors column-wise in kickoff order; dicts are only built for returned rows
+        games_df = games_df.sort_values('_kickoff', kind='stable')
+        kickoff_col = games_df['_kickoff']
+        renamed = {home_team_col: 'home_team', away_team_col: 'away_team', '_time_str': 'game_time_str'}
+        games_df = games_df.rename(columns=renamed)
+        table = GamesTable(
+            kickoff_ns=((kickoff_col - _EPOCH) // pd.Timedelta(1, 'ns')).to_numpy(dtype=np.int64),
+            kickoff=kickoff_col.to_numpy(dtype=object),
+            columns={
+                field: games_df[field].to_numpy(dtype=object) if field in games_df.columns
+                else np.full(len(games_df), 'Unknown', dtype=object)
+                for field in _GAME_FIELDS
+            }
+        )
+        
+        _SCHEDULE_CACHE['table'] = table
+        _SCHEDULE_CACHE['games_df'] = schedule_df
+        return table.rows()
         
     except Exception as e:
         cprint(f"Error fetching NFL schedule: {e}", "red")
         return []
 
-def get_next_nfl_games():
+def _games_table(all_games=None):
+    """Upcoming games as a GamesTable, from the cached schedule unless a games list is given"""
+    if all_games is not None:
+        return GamesTable.from_games(all_games)
+    
+    # Refreshes the cached table when the schedule download has expired
+    if _SCHEDULE_CACHE['games_df'] is not _load_schedule_df():
+        get_nfl_schedule_2025()
+    return _SCHEDULE_CACHE['table'] or GamesTable.from_games([])
+
+def _games_after(cutoff, now, all_games=None):
+    """Games at the earliest kickoff after cutoff, with minutes until kickoff from now"""
+    # Kickoffs are sorted, so the next slot is a binary search plus one more for its end
+    table = _games_table(all_games)
+    start = table.index_after(cutoff)
+    if start == len(table):
+        return []
+    
+    next_kickoff = table.kickoff[start]
+    minutes_until = int((next_kickoff - now).total_seconds() / 60)
+    
+    return [{
+        'game_time': next_kickoff,
+        'game_time_str': game['game_time_str'],
+        'home_team': game['home_team'],
+        'away_team': game['away_team'],
+        'season': game['season'],
+        'game_type': game['game_type'],
+        'week': game['week'],
+        'gameday': game['gameday'],
+        'weekday': game['weekday'],
+        'gametime': game['gametime'],
+        'minutes_until': minutes_until
+    } for game in table.rows(start, table.slot_end(start))]
+
+def get_next_nfl_games(all_games=None, now=None):
     """Get all upcoming NFL games starting at the next game time"""
     try:
-        all_games = get_nfl_schedule_2025()
-        
-        if not all_games:
-            return []
-        
-        current_time = datetime.now(pytz.timezone('US/Central'))
-        
-        # Find all upcoming games
-        upcoming_games = []
-        for game in all_games:
-            game_date = game['game_date']
-            
-            # Skip past games
-            if game_date <= current_time:
-                continue
-            
-            # Calculate time difference
-            time_diff = (game_date - current_time).total_seconds() / 60  # minutes
-            
-            upcoming_games.append({
-                'game_time': game_date,
-                'game_time_str': game['game_time_str'],
-                'home_team': game['home_team'],
-                'away_team': game['away_team'],
-                'season': game.get('season', 'Unknown'),
-                'game_type': game.get('game_type', 'Unknown'),
-                'week': game.get('week', 'Unknown'),
-                'gameday': game.get('gameday', 'Unknown'),
-                'weekday': game.get('weekday', 'Unknown'),
-                'gametime': game.get('gametime', 'Unknown'),
-                'minutes_until': int(time_diff)
-            })
-        
-        # Sort by game time
-        upcoming_games.sort(key=lambda x: x['game_time'])
-        
-        # Find the next game time
-        if not upcoming_games:
-            return []
-        
-        next_game_time = upcoming_games[0]['game_time']
-        
-        # Return all games at the next game time
-        next_games = [game for game in upcoming_games if game['game_time'] == next_game_time]
-        
-        return next_games
+        current_time = now or pd.Timestamp.now(tz=_CENTRAL)
+        return _games_after(current_time, current_time, all_games)
         
     except Exception as e:
         cprint(f"Error getting next NFL games: {e}", "red")
         return []
 
-def get_next_upcoming_games_after_current(current_games):
+def get_next_upcoming_games_after_current(current_games, all_games=None, now=None):
     """Get the next set of upcoming games after the current games being monitored"""
     try:
         if not current_games:
-            return get_next_nfl_games()
-        
-        all_games = get_nfl_schedule_2025()
-        
-        if not all_games:
-            return []
-        
-        current_time = datetime.now(pytz.timezone('US/Central'))
-        current_game_time = current_games[0]['game_time']
+            return get_next_nfl_games(all_games, now)
         
-        # Find all upcoming games after the current game time
-        upcoming_games = []
-        for game in all_games:
-            game_date = game['game_date']
-            
-            # Skip past games and current games
-            if game_date <= current_game_time:
-                continue
-            
-            # Calculate time difference
-            time_diff = (game_date - current_time).total_seconds() / 60  # minutes
-            
-            upcoming_games.append({
-                'game_time': game_date,
-                'game_time_str': game['game_time_str'],
-                'home_team': game['home_team'],
-                'away_team': game['away_team'],
-                'season': game.get('season', 'Unknown'),
-                'game_type': game.get('game_type', 'Unknown'),
-                'week': game.get('week', 'Unknown'),
-                'gameday': game.get('gameday', 'Unknown'),
-                'weekday': game.get('weekday', 'Unknown'),
-                'gametime': game.get('gametime', 'Unknown'),
-                'minutes_until': int(time_diff)
-            })
-        
-        # Sort by game time
-        upcoming_games.sort(key=lambda x: x['game_time'])
-        
-        # Find the next game time after current games
-        if not upcoming_games:
-            return []
-        
-        next_game_time = upcoming_games[0]['game_time']
-        
-        # Return all games at the next game time
-        next_games = [game for game in upcoming_games if game['game_time'] == next_game_time]
-        
-        return next_games
+        current_time = now or pd.Timestamp.now(tz=_CENTRAL)
+        return _games_after(current_games[0]['game_time'], current_time, all_games)
         
     except Exception as e:
         cprint(f"Error getting next upcoming games: {e}", "red")
         return []
 
-def is_game_within_trigger_window(game, trigger_window=60):
+def is_game_within_trigger_window(game, trigger_window=60, now=None):
     """Check if a game is within the trigger window"""
     if not game:
         return False
     
-    current_time = datetime.now(pytz.timezone('US/Central'))
+    current_time = now or pd.Timestamp.now(tz=_CENTRAL)
     game_time = game['game_time']
     time_diff_minutes = (game_time - current_time).total_seconds() / 60
     
     return 0 <= time_diff_minutes <= trigger_window
 
+def _teams_csv(games):
+    """Comma-separated, sorted team codes playing in the given games"""
+    return ', '.join(sorted({team for game in games for team in (game['home_team'], game['away_team'])}))
+
+def _buffered(buf, text, color, attrs=None):
+    """Append a colored line to the monitor's per-tick output buffer"""
+    buf.write(colored(text, color, attrs=attrs))
+    buf.write("\n")
+
+def _flush_output(buf):
+    """Write everything buffered so far in one call and reset the buffer"""
+    if buf.tell():
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+        buf.seek(0)
+        buf.truncate()
+
 def monitor_nfl_games(check_interval=600, trigger_window=60, scraping_callback=None, auto_continue=True):
     """Monitor for the next upcoming NFL game and trigger PrizePicks scraping when within trigger window"""
     cprint(f"\n🎯 Starting NFL Game Monitoring...", "green", attrs=["bold"])
@@ -284,100 +335,139 @@ def monitor_nfl_games(check_interval=600, trigger_window=60, scraping_callback=N
     cprint(f"   Auto-continue: {'Enabled' if auto_continue else 'Disabled'}", "cyan")
     cprint(f"   Press Ctrl+C to stop monitoring\n", "yellow")
     
+    # Kickoff epoch seconds already scraped; the deque bounds the set to the most recent ones
     last_triggered_games = set()
+    triggered_order = deque()
     current_monitoring_games = None
+    wake_event = threading.Event()
+    out = io.StringIO()
+    shown_slot = None
+    # Last fetched slot and when its trigger window opens, so quiet ticks skip the schedule read
+    cached_games = []
+    next_trigger_at = None
     
     try:
         while True:
-            cprint(f"⏰ Checking for next upcoming NFL game... ({datetime.now().strftime('%H:%M:%S')})", "cyan")
+            # Full interval by default; shortened below when a trigger window opens sooner
+            tick_started = time.monotonic()
+            sleep_seconds = check_interval
+            _buffered(out, f"⏰ Checking for next upcoming NFL game... ({datetime.now().strftime('%H:%M:%S')})", "cyan")
             
             try:
+                # One clock read per tick, shared by every time comparison below
+                current_time = pd.Timestamp.now(tz=_CENTRAL)
+                
                 # Get games to monitor (either next games or continue with current)
                 if current_monitoring_games is None:
-                    next_games = get_next_nfl_games()
+                    if cached_games and current_time < next_trigger_at - timedelta(seconds=check_interval):
+                        # Trigger window is more than one interval away, the last read still holds
+                        next_games = cached_games
+                    else:
+                        next_games = get_next_nfl_games(now=current_time)
+                        cached_games = next_games
+                        if next_games:
+                            next_trigger_at = next_games[0]['game_time'] - timedelta(minutes=trigger_window)
                 else:
                     # Check if current games are still upcoming
-                    current_time = datetime.now(pytz.timezone('US/Central'))
                     if current_monitoring_games and current_monitoring_games[0]['game_time'] > current_time:
                         next_games = current_monitoring_games
                     else:
                         # Current games have passed, get next set
-                        next_games = get_next_upcoming_games_after_current(current_monitoring_games)
+                        next_games = get_next_upcoming_games_after_current(current_monitoring_games, now=current_time)
                         current_monitoring_games = next_games
                 
                 if next_games:
-                    # Display all games at the next time slot
-                    if len(next_games) == 1:
-                        game = next_games[0]
-                        game_key = f"{game['away_team']} vs {game['home_team']} at {game['game_time_str']}"
-                        cprint(f"🏈 Found: {game_key}", "green", attrs=["bold"])
-                    else:
-                        cprint(f"🏈 Found {len(next_games)} games at {next_games[0]['game_time_str']}:", "green", attrs=["bold"])
-                        for i, game in enumerate(next_games, 1):
-                            game_key = f"{game['away_team']} vs {game['home_team']}"
-                            cprint(f"   {i}. {game_key}", "green")
-                    
-                    # Show common game details
                     first_game = next_games[0]
-                    minutes_until = first_game['minutes_until']
-                    cprint(f"     Season: {first_game.get('season', 'Unknown')} | Week: {first_game.get('week', 'Unknown')} | Type: {first_game.get('game_type', 'Unknown')}", "cyan")
-                    cprint(f"     Game Day: {first_game.get('gameday', 'Unknown')} | Weekday: {first_game.get('weekday', 'Unknown')} | Time: {first_game.get('gametime', 'Unknown')}", "cyan")
+                    minutes_until = int((first_game['game_time'] - current_time).total_seconds() / 60)
+                    
+                    # Display all games at the next time slot, only when the slot changes
+                    slot_key = (first_game['game_time'], tuple((game['away_team'], game['home_team']) for game in next_games))
+                    if slot_key != shown_slot:
+                        shown_slot = slot_key
+                        if len(next_games) == 1:
+                            game_key = f"{first_game['away_team']} vs {first_game['home_team']} at {first_game['game_time_str']}"
+                            _buffered(out, f"🏈 Found: {game_key}", "green", attrs=["bold"])
+                        else:
+                            _buffered(out, f"🏈 Found {len(next_games)} games at {first_game['game_time_str']}:", "green", attrs=["bold"])
+                            for i, game in enumerate(next_games, 1):
+                                game_key = f"{game['away_team']} vs {game['home_team']}"
+                                _buffered(out, f"   {i}. {game_key}", "green")
+                        
+                        # Show common game details
+                        _buffered(out, f"     Season: {first_game['season']} | Week: {first_game['week']} | Type: {first_game['game_type']}", "cyan")
+                        _buffered(out, f"     Game Day: {first_game['gameday']} | Weekday: {first_game['weekday']} | Time: {first_game['gametime']}", "cyan")
                     
                     # Check if games are within trigger window
-                    if is_game_within_trigger_window(first_game, trigger_window):
-                        cprint(f"🚀 Games start in {minutes_until} minutes - TRIGGERING PrizePicks scraping!", "green", attrs=["bold"])
-                        cprint(f"   Scraper will find players for all {len(next_games)} game(s) at this time slot", "cyan")
-                        cprint(f"   Teams: {', '.join(sorted(set([game['home_team'] for game in next_games] + [game['away_team'] for game in next_games])))}", "cyan")
+                    if is_game_within_trigger_window(first_game, trigger_window, current_time):
+                        _buffered(out, f"🚀 Games start in {minutes_until} minutes - TRIGGERING PrizePicks scraping!", "green", attrs=["bold"])
+                        _buffered(out, f"   Scraper will find players for all {len(next_games)} game(s) at this time slot", "cyan")
+                        _buffered(out, f"   Teams: {_teams_csv(next_games)}", "cyan")
                         
                         # Trigger scraping once for all games at this time
-                        if first_game['game_time'] not in last_triggered_games:
-                            last_triggered_games.add(first_game['game_time'])
+                        kickoff_ts = int(first_game['game_time'].timestamp())
+                        if kickoff_ts not in last_triggered_games:
+                            if len(triggered_order) >= TRIGGERED_HISTORY:
+                                last_triggered_games.discard(triggered_order.popleft())
+                            triggered_order.append(kickoff_ts)
+                            last_triggered_games.add(kickoff_ts)
                             
                             # Call the scraping callback if provided
                             if scraping_callback:
+                                _flush_output(out)
                                 scrape_success = scraping_callback(next_games, None)  # Pass all games at this time slot
                                 
                                 # If auto-continue is enabled and scraping was successful, identify next games to monitor
                                 if auto_continue and scrape_success:
-                                    cprint(f"✅ Scraping completed successfully! Identifying next games to monitor...", "green", attrs=["bold"])
+                                    _buffered(out, f"✅ Scraping completed successfully! Identifying next games to monitor...", "green", attrs=["bold"])
                                     # Get the next set of games after current ones
                                     next_upcoming = get_next_upcoming_games_after_current(next_games)
                                     if next_upcoming:
                                         current_monitoring_games = next_upcoming
-                                        cprint(f"🔄 Now monitoring next games: {next_upcoming[0]['away_team']} vs {next_upcoming[0]['home_team']} at {next_upcoming[0]['game_time_str']}", "cyan")
-                                        cprint(f"   Will wait until {next_upcoming[0]['minutes_until']} minutes before game time to scrape", "cyan")
+                                        _buffered(out, f"🔄 Now monitoring next games: {next_upcoming[0]['away_team']} vs {next_upcoming[0]['home_team']} at {next_upcoming[0]['game_time_str']}", "cyan")
+                                        _buffered(out, f"   Will wait until {next_upcoming[0]['minutes_until']} minutes before game time to scrape", "cyan")
                                     else:
-                                        cprint(f"ℹ️  No more upcoming games found. Monitoring will continue for any new games.", "yellow")
+                                        _buffered(out, f"ℹ️  No more upcoming games found. Monitoring will continue for any new games.", "yellow")
                                         current_monitoring_games = None
                         else:
-                            cprint(f"   ⚠️  Already triggered scraping for this time slot", "yellow")
+                            _buffered(out, f"   ⚠️  Already triggered scraping for this time slot", "yellow")
                     else:
+                        # Wake when the trigger window opens rather than on the next full interval
+                        window_opens = first_game['game_time'] - timedelta(minutes=trigger_window)
+                        seconds_to_window = (window_opens - current_time).total_seconds()
+                        sleep_seconds = max(5, min(check_interval, int(seconds_to_window)))
+                        
                         hours_until = minutes_until / 60
                         if hours_until < 24:
-                            cprint(f"⏳ Waiting until closer to game time to scrape: {hours_until:.1f} hours remaining", "yellow")
+                            _buffered(out, f"⏳ Waiting until closer to game time to scrape: {hours_until:.1f} hours remaining", "yellow")
                         else:
                             days_until = hours_until / 24
-                            cprint(f"⏳ Waiting until closer to game time to scrape: {days_until:.1f} days remaining", "yellow")
+                            _buffered(out, f"⏳ Waiting until closer to game time to scrape: {days_until:.1f} days remaining", "yellow")
                 else:
-                    cprint("   No upcoming NFL games found", "yellow")
+                    _buffered(out, "   No upcoming NFL games found", "yellow")
                     current_monitoring_games = None
+                    shown_slot = None
                 
             except Exception as e:
-                cprint(f"   Error during monitoring check: {e}", "red")
+                _buffered(out, f"   Error during monitoring check: {e}", "red")
             
-            # Wait before next check
-            minutes = check_interval // 60
-            seconds = check_interval % 60
+            # Wait before next check, counted from the start of this tick so time spent
+            # checking or scraping does not push later checks back
+            sleep_seconds = max(0, round(tick_started + sleep_seconds - time.monotonic()))
+            minutes = sleep_seconds // 60
+            seconds = sleep_seconds % 60
             if minutes > 0:
                 time_str = f"{minutes} minutes" if seconds == 0 else f"{minutes} minutes {seconds} seconds"
             else:
-                time_str = f"{check_interval} seconds"
-            cprint(f"   Next check in {time_str}...\n", "cyan")
-            time.sleep(check_interval)
+                time_str = f"{sleep_seconds} seconds"
+            _buffered(out, f"   Next check in {time_str}...\n", "cyan")
+            _flush_output(out)
+            wake_event.wait(sleep_seconds)
             
     except KeyboardInterrupt:
+        _flush_output(out)
         cprint(f"\n🛑 NFL game monitoring stopped by user", "yellow", attrs=["bold"])
     except Exception as e:
+        _flush_output(out)
         cprint(f"\n❌ Error in monitoring: {e}", "red")
 
 def show_upcoming_games_schedule():
@@ -386,31 +476,22 @@ def show_upcoming_games_schedule():
     cprint("="*60, "cyan")
     
     try:
-        all_games = get_nfl_schedule_2025()
-        if not all_games:
+        table = _games_table()
+        if not len(table):
             cprint("No upcoming games found", "yellow")
             return
         
-        current_time = datetime.now(pytz.timezone('US/Central'))
+        current_time = pd.Timestamp.now(tz=_CENTRAL)
         today = current_time.date()
         
-        # Filter games for today only
-        today_games = []
-        for game in all_games:
-            game_date = game['game_date']
-            if game_date.date() == today and game_date > current_time:
-                # Calculate minutes until game
-                time_diff = (game_date - current_time).total_seconds() / 60
-                game['minutes_until'] = int(time_diff)
-                today_games.append(game)
+        # Today's remaining games are one contiguous run of the kickoff-sorted table
+        tomorrow = (current_time + pd.Timedelta(days=1)).normalize()
+        today_games = table.rows(table.index_after(current_time), table.index_from(tomorrow))
         
         if not today_games:
             cprint("No games scheduled for today", "yellow")
             return
         
-        # Sort games by time
-        today_games.sort(key=lambda x: x['game_date'])
-        
         # Display today's games
         date_str = today.strftime('%A, %B %d, %Y')
         cprint(f"\n📅 {date_str}", "yellow", attrs=["bold"])
@@ -418,7 +499,8 @@ def show_upcoming_games_schedule():
         for game in today_games:
             time_str = game['game_time_str']
             teams = f"{game['away_team']} vs {game['home_team']}"
-            minutes_until = game['minutes_until']
+            # Calculate minutes until game
+            minutes_until = int((game['game_date'] - current_time).total_seconds() / 60)
             
             if minutes_until < 60:
                 time_info = f"{minutes_until} min"
@@ -437,11 +519,15 @@ def show_upcoming_games_schedule():
     except Exception as e:
         cprint(f"Error showing schedule: {e}", "red")
 
+def _get_scraper(name):
+    """Return a scraper module, importing it on first use (visit_prizepicks imports this module); failed imports aren't cached so a later trigger retries"""
+    return sys.modules.get(name) or importlib.import_module(name)
+
 def run_sequential_scraping_callback(games_info, sheets_service=None):
     """Run both PrizePicks and Underdog scrapers sequentially for monitoring (one after the other)"""
     cprint(f"\n🚀 Starting SEQUENTIAL SCRAPING SESSION...", "green", attrs=["bold"])
     cprint(f"   Games: {len(games_info)} game(s) at {games_info[0]['game_time_str']}", "cyan")
-    cprint(f"   Teams: {', '.join(sorted(set([game['home_team'] for game in games_info] + [game['away_team'] for game in games_info])))}", "cyan")
+    cprint(f"   Teams: {_teams_csv(games_info)}", "cyan")
     cprint(f"   Sequence: PrizePicks → Underdog Fantasy (one after the other)", "yellow")
     
     overall_success = True
@@ -452,8 +538,7 @@ def run_sequential_scraping_callback(games_info, sheets_service=None):
     cprint(f"{'='*60}", "cyan")
     
     try:
-        import visit_prizepicks
-        prizepicks_success = visit_prizepicks.run_monitoring_scraping(games_info, sheets_service)
+        prizepicks_success = _get_scraper('visit_prizepicks').run_monitoring_scraping(games_info, sheets_service)
         
         if prizepicks_success:
             cprint("✅ PrizePicks scraping completed successfully!", "green", attrs=["bold"])
@@ -471,8 +556,7 @@ def run_sequential_scraping_callback(games_info, sheets_service=None):
     cprint(f"{'='*60}", "cyan")
     
     try:
-        import visit_underdog
-        underdog_success = visit_underdog.run_monitoring_scraping(games_info, sheets_service)
+        underdog_success = _get_scraper('visit_underdog').run_monitoring_scraping(games_info, sheets_service)
         
         if underdog_success:
             cprint("✅ Underdog Fantasy scraping completed successfully!", "green", attrs=["bold"])
@@ -496,11 +580,58 @@ def run_sequential_scraping_callback(games_info, sheets_service=None):
     
     return overall_success
 
-def run_monitoring_session(scraping_callback=None, trigger_window_hours=1, auto_continue=True, use_sequential_scraping=True):
+def _run_scraper(name, games_info, sheets_service=None):
+    """Run one scraper module's monitoring entry point"""
+    return _get_scraper(name).run_monitoring_scraping(games_info, sheets_service)
+
+def run_parallel_scraping_callback(games_info, sheets_service=None):
+    """Run both PrizePicks and Underdog scrapers at the same time for monitoring"""
+    cprint(f"\n🚀 Starting PARALLEL SCRAPING SESSION...", "green", attrs=["bold"])
+    cprint(f"   Games: {len(games_info)} game(s) at {games_info[0]['game_time_str']}", "cyan")
+    cprint(f"   Teams: {_teams_csv(games_info)}", "cyan")
+    cprint(f"   Running: PrizePicks + Underdog Fantasy (at the same time)", "yellow")
+    
+    overall_success = True
+    scrapers = {'visit_prizepicks': 'PrizePicks', 'visit_underdog': 'Underdog Fantasy'}
+    
+    # Each scraper drives its own browser, so they only share wall-clock time
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        futures = {
+            executor.submit(_run_scraper, name, games_info, sheets_service): label
+            for name, label in scrapers.items()
+        }
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                if future.result():
+                    cprint(f"✅ {label} scraping completed successfully!", "green", attrs=["bold"])
+                else:
+                    cprint(f"❌ {label} scraping failed!", "red", attrs=["bold"])
+                    overall_success = False
+            except Exception as e:
+                cprint(f"❌ Error running {label} scraper: {e}", "red")
+                overall_success = False
+    
+    # Final summary
+    cprint(f"\n{'='*60}", "cyan")
+    cprint("PARALLEL SCRAPING SESSION COMPLETE", "green" if overall_success else "red", attrs=["bold"])
+    cprint(f"{'='*60}", "cyan")
+    
+    if overall_success:
+        cprint("🎉 Both scrapers completed successfully!", "green", attrs=["bold"])
+    else:
+        cprint("⚠️  One or more scrapers encountered issues", "yellow", attrs=["bold"])
+    
+    return overall_success
+
+def run_monitoring_session(scraping_callback=None, trigger_window_hours=1, auto_continue=True, use_sequential_scraping=True, use_parallel_scraping=False):
     """Run the monitoring mode session"""
     cprint(f"\n🎯 Starting NFL Game Monitoring Mode...", "green", attrs=["bold"])
     
-    if use_sequential_scraping:
+    if use_parallel_scraping:
+        cprint("This will monitor NFL official data for upcoming games and trigger BOTH PrizePicks and Underdog scraping.", "cyan")
+        cprint("🔄 Scraping mode: PrizePicks + Underdog Fantasy (at the same time)", "yellow")
+    elif use_sequential_scraping:
         cprint("This will monitor NFL official data for upcoming games and trigger BOTH PrizePicks and Underdog scraping.", "cyan")
         cprint("🔄 Scraping sequence: PrizePicks → Underdog Fantasy (one after the other)", "yellow")
     else:
@@ -514,7 +645,10 @@ def run_monitoring_session(scraping_callback=None, trigger_window_hours=1, auto_
     
     # Set up the scraping callback
     if scraping_callback is None:
-        if use_sequential_scraping:
+        if use_parallel_scraping:
+            scraping_callback = run_parallel_scraping_callback
+            cprint("✅ Using parallel scraping callback (PrizePicks + Underdog)", "green")
+        elif use_sequential_scraping:
             scraping_callback = run_sequential_scraping_callback
             cprint("✅ Using sequential scraping callback (PrizePicks → Underdog)", "green")
         else:
@@ -3,6 +3,7 @@
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 import nfl_data_py as nfl
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import re
@@ -11,22 +12,36 @@ from typing import Dict, List, Optional, Any
 from termcolor import cprint
 import pytz
 
+# Game time formats from the sheets, compiled once instead of looked up on every parse
+_DAY_TIME_RE = re.compile(r'(\w{3})\s+(\d{1,2}):(\d{2})([ap]m)', re.IGNORECASE)
+_TIME_ONLY_RE = re.compile(r'(\d{1,2}):(\d{2})([ap]m)', re.IGNORECASE)
+# Countdown timers ("12m 30s"): an 'm', an 's' and a digit anywhere in the string
+_COUNTDOWN_RE = re.compile(r'\A(?=.*m)(?=.*s)(?=.*\d)', re.DOTALL)
+# Abbreviated play-by-play names as (initial, last name): "j.hurts" (exactly one dot) or "j hurts"
+_ABBREVIATED_NAME_RE = re.compile(r'\A(?:([^.]*)\.([^.]*)|([^. ]) ([^.]*))\Z')
+
+# Sheet team abbreviations to nfl_data_py team codes, shared by every fetcher
+_TEAM_MAPPING = {
+    'ARI': 'ARI', 'ATL': 'ATL', 'BAL': 'BAL', 'BUF': 'BUF', 'CAR': 'CAR',
+    'CHI': 'CHI', 'CIN': 'CIN', 'CLE': 'CLE', 'DAL': 'DAL', 'DEN': 'DEN',
+    'DET': 'DET', 'GB': 'GB', 'HOU': 'HOU', 'IND': 'IND', 'JAC': 'JAX',
+    'KC': 'KC', 'LV': 'LV', 'LAC': 'LAC', 'LAR': 'LAR', 'MIA': 'MIA',
+    'MIN': 'MIN', 'NE': 'NE', 'NO': 'NO', 'NYG': 'NYG', 'NYJ': 'NYJ',
+    'PHI': 'PHI', 'PIT': 'PIT', 'SF': 'SF', 'SEA': 'SEA', 'TB': 'TB',
+    'TEN': 'TEN', 'WAS': 'WAS'
+}
+
+_DAY_MAP = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+
 class NFLStatsFetcher:
-    def __init__(self, spreadsheet_id: str, service_account_file: str = 'service-account-key.json'):
+    def __init__(self, spreadsheet_id: str, service_account_file: str = 'service-account-key.json',
+                 sheets_service=None):
         self.spreadsheet_id = spreadsheet_id
         self.service_account_file = service_account_file
-        self.sheets_service = self._setup_google_sheets()
+        self.sheets_service = sheets_service or self._setup_google_sheets()
         
         # Team abbreviation mapping for nfl_data_py
-        self.team_mapping = {
-            'ARI': 'ARI', 'ATL': 'ATL', 'BAL': 'BAL', 'BUF': 'BUF', 'CAR': 'CAR',
-            'CHI': 'CHI', 'CIN': 'CIN', 'CLE': 'CLE', 'DAL': 'DAL', 'DEN': 'DEN',
-            'DET': 'DET', 'GB': 'GB', 'HOU': 'HOU', 'IND': 'IND', 'JAC': 'JAX',
-            'KC': 'KC', 'LV': 'LV', 'LAC': 'LAC', 'LAR': 'LAR', 'MIA': 'MIA',
-            'MIN': 'MIN', 'NE': 'NE', 'NO': 'NO', 'NYG': 'NYG', 'NYJ': 'NYJ',
-            'PHI': 'PHI', 'PIT': 'PIT', 'SF': 'SF', 'SEA': 'SEA', 'TB': 'TB',
-            'TEN': 'TEN', 'WAS': 'WAS'
-        }
+        self.team_mapping = _TEAM_MAPPING
         
         # Stat type mapping to nfl_data_py columns
         self.stat_mapping = {
@@ -49,6 +64,18 @@ class NFLStatsFetcher:
             'Kicking Points': 'kicking_points',  # Will calculate from PBP
             'Tackles+Ast': 'tackles'  # Will calculate from PBP
         }
+        
+        # Downloaded frames by year, so each year's schedule and stats are fetched once per run
+        self._schedule_cache: Dict[int, pd.DataFrame] = {}
+        self._weekly_cache: Dict[int, pd.DataFrame] = {}
+        # {frozenset((home, away)): week} per year, built alongside each cached schedule
+        self._week_lookup: Dict[int, Dict[frozenset, int]] = {}
+        
+        # Name lookup index over the last stats frame passed in (see _get_stats_index)
+        self._stats_index_source = None
+        self._stats_index = {}
+        self._stats_names = pd.DataFrame()
+        self._team_week_rows: Dict[tuple, np.ndarray] = {}
 
     def _setup_google_sheets(self):
         try:
@@ -68,52 +95,80 @@ class NFLStatsFetcher:
                 range=range_name
             ).execute()
             
-            values = result.get('values', [])
-            if len(values) <= 1:
-                return []
-            
-            players = []
-            for i, row in enumerate(values[1:], start=2):  # Skip header, start from row 2
-                if len(row) >= 5:
-                    players.append({
-                        'row_index': i,
-                        'player_name': row[0].strip(),
-                        'position': row[1].strip(),
-                        'team': row[2].strip(),
-                        'opponent': row[3].strip(),
-                        'game_time': row[4].strip(),
-                        'line': row[5] if len(row) > 5 else '',
-                        'payout_type': row[6] if len(row) > 6 else 'Standard',
-                        'actual': row[7] if len(row) > 7 else '',
-                        'over_under': row[8] if len(row) > 8 else '',
-                        'stat_type': sheet_name.replace(' Plus ', '+')
-                    })
-            
-            return players
+            return self._parse_values(sheet_name, result.get('values', []))
         except Exception as e:
             cprint(f"Error reading sheet {sheet_name}: {e}", "red")
             return []
 
+    def read_all_sheets(self, sheet_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Read every sheet's players in a single values.batchGet round trip"""
+        if not sheet_names:
+            return {}
+        
+        try:
+            result = self.sheets_service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=[f"'{sheet_name}'!A:I" for sheet_name in sheet_names],
+                fields='valueRanges.values'
+            ).execute()
+            
+            # valueRanges come back in the same order as the requested ranges
+            value_ranges = result.get('valueRanges', [])
+            return {
+                sheet_name: self._parse_values(sheet_name, value_range.get('values', []))
+                for sheet_name, value_range in zip(sheet_names, value_ranges)
+            }
+        except Exception as e:
+            cprint(f"Error batch reading sheets: {e}", "red")
+            return {}
+
+    def _parse_values(self, sheet_name: str, values: List[List[Any]]) -> List[Dict[str, Any]]:
+        """Turn a sheet's raw values (header row included) into player dicts"""
+        if len(values) <= 1:
+            return []
+        
+        players = []
+        for i, row in enumerate(values[1:], start=2):  # Skip header, start from row 2
+            if len(row) >= 5:
+                players.append({
+                    'row_index': i,
+                    'player_name': row[0].strip(),
+                    'position': row[1].strip(),
+                    'team': row[2].strip(),
+                    'opponent': row[3].strip(),
+                    'game_time': row[4].strip(),
+                    'line': row[5] if len(row) > 5 else '',
+                    'payout_type': row[6] if len(row) > 6 else 'Standard',
+                    'actual': row[7] if len(row) > 7 else '',
+                    'over_under': row[8] if len(row) > 8 else '',
+                    'stat_type': sheet_name.replace(' Plus ', '+')
+                })
+        
+        return players
+
     def get_all_sheets(self) -> List[str]:
         try:
             spreadsheet = self.sheets_service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id).execute()
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties.title').execute()
             return [sheet['properties']['title'] for sheet in spreadsheet['sheets']]
         except Exception as e:
             cprint(f"Error getting sheet names: {e}", "red")
             return []
 
-    def parse_game_date(self, game_time_str: str) -> Optional[datetime]:
+    def parse_game_date(self, game_time_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
         try:
+            # Callers parsing a whole sheet pass one shared clock reading
+            today = now or datetime.now()
             
             # Handle countdown timers - these are always today's games
-            if 'm' in game_time_str and 's' in game_time_str and any(char.isdigit() for char in game_time_str):
-                return datetime.now().date()
+            if _COUNTDOWN_RE.match(game_time_str):
+                return today.date()
             
             game_time_clean = game_time_str.strip()
             
             # Handle format like "Thu 07:15PM" (day + time)
-            match = re.match(r'(\w{3})\s+(\d{1,2}):(\d{2})([ap]m)', game_time_clean, re.IGNORECASE)
+            match = _DAY_TIME_RE.match(game_time_clean)
             if match:
                 day_abbr, hour, minute, ampm = match.groups()
                 hour = int(hour)
@@ -124,13 +179,11 @@ class NFLStatsFetcher:
                 elif ampm.lower() == 'am' and hour == 12:
                     hour = 0
                 
-                day_map = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
-                day_num = day_map.get(day_abbr.lower())
+                day_num = _DAY_MAP.get(day_abbr.lower())
                 if day_num is None:
                     cprint(f"Unknown day abbreviation: {day_abbr}", "red")
                     return None
                 
-                today = datetime.now()
                 days_ahead = (day_num - today.weekday()) % 7
                 if days_ahead == 0 and (hour < today.hour or (hour == today.hour and minute <= today.minute)):
                     days_ahead = 7
@@ -139,7 +192,7 @@ class NFLStatsFetcher:
                 return game_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
             
             # Handle format like "7:15PM CDT" (time + timezone, no day)
-            match = re.match(r'(\d{1,2}):(\d{2})([ap]m)', game_time_clean, re.IGNORECASE)
+            match = _TIME_ONLY_RE.match(game_time_clean)
             if match:
                 hour, minute, ampm = match.groups()
                 hour = int(hour)
@@ -151,7 +204,6 @@ class NFLStatsFetcher:
                     hour = 0
                 
                 # For time-only format, assume it's today's game
-                today = datetime.now()
                 game_date = today.replace(hour=hour, minute=minute, second=0, microsecond=0)
                 
                 # If the time has already passed today, assume it's tomorrow
@@ -172,6 +224,21 @@ class NFLStatsFetcher:
         if year is None:
             year = datetime.now().year
         
+        if year not in self._schedule_cache:
+            game_data = self._fetch_nfl_game_data(year)
+            self._schedule_cache[year] = game_data
+            
+            # Either team can be home; a rematch keeps the first (earliest listed) meeting's week
+            week_lookup = {}
+            if not game_data.empty:
+                games = game_data.dropna(subset=['week'])
+                for home, away, week in zip(games['home_team'], games['away_team'], games['week']):
+                    week_lookup.setdefault(frozenset((home, away)), int(week))
+            self._week_lookup[year] = week_lookup
+        return self._schedule_cache[year]
+
+    def _fetch_nfl_game_data(self, year: int) -> pd.DataFrame:
+        """Download NFL game data for the specified year"""
         try:
             # Try multiple years to find available data
             years_to_try = [year, year - 1, year + 1]
@@ -202,6 +269,16 @@ class NFLStatsFetcher:
         if year is None:
             year = datetime.now().year
         
+        if year not in self._weekly_cache:
+            stats_data = self._fetch_player_stats_data(year)
+            # Team codes as categories and weeks as small ints keep the per-lookup team/week masks cheap
+            dtypes = {'recent_team': 'category', 'week': 'int16'}
+            stats_data = stats_data.astype({col: dtype for col, dtype in dtypes.items() if col in stats_data.columns})
+            self._weekly_cache[year] = stats_data
+        return self._weekly_cache[year]
+
+    def _fetch_player_stats_data(self, year: int) -> pd.DataFrame:
+        """Download player stats data for the specified year"""
         try:
             # Try multiple years to find available data
             years_to_try = [year, year - 1, year + 1]
@@ -213,6 +290,9 @@ class NFLStatsFetcher:
                     
                     if not stats_data.empty:
                         cprint(f"Found weekly player stats data for {test_year} ({len(stats_data)} records)", "green")
+                        # Missing stats count as zero; filled once here instead of checked per lookup
+                        numeric_columns = stats_data.select_dtypes('number').columns
+                        stats_data[numeric_columns] = stats_data[numeric_columns].fillna(0)
                         return stats_data
                         
                 except Exception as e:
@@ -247,146 +327,114 @@ class NFLStatsFetcher:
             if pbp_data.empty:
                 return pd.DataFrame()
             
-            # Group by player and week to calculate stats
-            weekly_stats = []
-            
-            # Get unique players and weeks
-            players = set()
-            weeks = set()
-            
-            # Collect all unique players from various play types
-            for col in ['passer_player_name', 'rusher_player_name', 'receiver_player_name', 'kicker_player_name',
-                       'sack_player_name', 'solo_tackle_1_player_name', 'solo_tackle_2_player_name',
-                       'assist_tackle_1_player_name', 'assist_tackle_2_player_name', 'assist_tackle_3_player_name', 'assist_tackle_4_player_name']:
-                if col in pbp_data.columns:
-                    players.update(pbp_data[col].dropna().unique())
-            
-            weeks = pbp_data['week'].unique()
+            # Plays without a week can't be credited; the positional index keeps play order for "first play"
+            plays = pbp_data[pbp_data['week'].notna()].reset_index(drop=True)
+            keys = ['player_name', 'week']
+            
+            # Every (play, player, role) credit in one long frame instead of one full scan per player and week
+            role_columns = [
+                ('passer', 'passer_player_name'), ('rusher', 'rusher_player_name'),
+                ('receiver', 'receiver_player_name'), ('kicker', 'kicker_player_name'),
+                ('sack', 'sack_player_name'),
+                ('solo_tackle', 'solo_tackle_1_player_name'), ('solo_tackle', 'solo_tackle_2_player_name'),
+                ('assist_tackle', 'assist_tackle_1_player_name'), ('assist_tackle', 'assist_tackle_2_player_name'),
+                ('assist_tackle', 'assist_tackle_3_player_name'), ('assist_tackle', 'assist_tackle_4_player_name')
+            ]
             
-            for player in players:
-                if pd.isna(player) or player == '':
-                    continue
-                    
-                for week in weeks:
-                    if pd.isna(week):
-                        continue
-                    
-                    # Filter plays for this player in this week
-                    player_plays = pbp_data[
-                        ((pbp_data['passer_player_name'] == player) |
-                         (pbp_data['rusher_player_name'] == player) |
-                         (pbp_data['receiver_player_name'] == player) |
-                         (pbp_data['kicker_player_name'] == player) |
-                         (pbp_data['sack_player_name'] == player) |
-                         (pbp_data['solo_tackle_1_player_name'] == player) |
-                         (pbp_data['solo_tackle_2_player_name'] == player) |
-                         (pbp_data['assist_tackle_1_player_name'] == player) |
-                         (pbp_data['assist_tackle_2_player_name'] == player) |
-                         (pbp_data['assist_tackle_3_player_name'] == player) |
-                         (pbp_data['assist_tackle_4_player_name'] == player)) &
-                        (pbp_data['week'] == week)
-                    ]
-                    
-                    if player_plays.empty:
-                        continue
-                    
-                    # Calculate stats
-                    passing_yards = player_plays[player_plays['passer_player_name'] == player]['passing_yards'].sum()
-                    passing_tds = player_plays[player_plays['passer_player_name'] == player]['pass_touchdown'].sum()
-                    passing_attempts = len(player_plays[player_plays['passer_player_name'] == player])
-                    passing_completions = player_plays[player_plays['passer_player_name'] == player]['complete_pass'].sum()
-                    interceptions = player_plays[player_plays['passer_player_name'] == player]['interception'].sum()
-                    
-                    rushing_yards = player_plays[player_plays['rusher_player_name'] == player]['rushing_yards'].sum()
-                    rushing_tds = player_plays[player_plays['rusher_player_name'] == player]['rush_touchdown'].sum()
-                    rushing_attempts = len(player_plays[player_plays['rusher_player_name'] == player])
-                    
-                    receiving_yards = player_plays[player_plays['receiver_player_name'] == player]['receiving_yards'].sum()
-                    receiving_tds = player_plays[player_plays['receiver_player_name'] == player]['pass_touchdown'].sum()
-                    receptions = player_plays[player_plays['receiver_player_name'] == player]['complete_pass'].sum()
-                    targets = len(player_plays[player_plays['receiver_player_name'] == player])
-                    
-                    # Calculate defensive stats
-                    sacks = len(player_plays[player_plays['sack_player_name'] == player])
-                    solo_tackles = len(player_plays[player_plays['solo_tackle_1_player_name'] == player]) + len(player_plays[player_plays['solo_tackle_2_player_name'] == player])
-                    assist_tackles = (len(player_plays[player_plays['assist_tackle_1_player_name'] == player]) + 
-                                    len(player_plays[player_plays['assist_tackle_2_player_name'] == player]) +
-                                    len(player_plays[player_plays['assist_tackle_3_player_name'] == player]) +
-                                    len(player_plays[player_plays['assist_tackle_4_player_name'] == player]))
-                    tackles_plus_assists = solo_tackles + assist_tackles
-                    
-                    # Calculate kicking stats
-                    field_goals_made = len(player_plays[(player_plays['kicker_player_name'] == player) & 
-                                                       (player_plays['field_goal_attempt'] == 1) & 
-                                                       (player_plays['field_goal_result'] == 'made')])
-                    field_goals_attempted = len(player_plays[(player_plays['kicker_player_name'] == player) & 
-                                                            (player_plays['field_goal_attempt'] == 1)])
-                    
-                    # Calculate kicking points (3 points per field goal made)
-                    kicking_points = field_goals_made * 3
-                    
-                    # Get team from the first play
-                    first_play = player_plays.iloc[0]
-                    
-                    # For defensive players (sacks, tackles), assign to the defensive team
-                    if (player_plays['sack_player_name'] == player).any() or \
-                       (player_plays['solo_tackle_1_player_name'] == player).any() or \
-                       (player_plays['solo_tackle_2_player_name'] == player).any() or \
-                       (player_plays['assist_tackle_1_player_name'] == player).any() or \
-                       (player_plays['assist_tackle_2_player_name'] == player).any() or \
-                       (player_plays['assist_tackle_3_player_name'] == player).any() or \
-                       (player_plays['assist_tackle_4_player_name'] == player).any():
-                        # For defensive players, use the defteam (defensive team)
-                        team = first_play['defteam']
-                    elif (player_plays['kicker_player_name'] == player).any():
-                        # For kickers, prioritize field goal and extra point attempts to determine their team
-                        fg_xp_plays = player_plays[
-                            (player_plays['kicker_player_name'] == player) & 
-                            ((player_plays['field_goal_attempt'] == 1) | (player_plays['extra_point_attempt'] == 1))
-                        ]
-                        if not fg_xp_plays.empty:
-                            team = fg_xp_plays.iloc[0]['posteam']
-                        else:
-                            # Fallback to first play's posteam
-                            team = first_play['posteam'] if first_play['posteam'] == first_play['home_team'] or first_play['posteam'] == first_play['away_team'] else first_play['home_team']
-                    else:
-                        # For offensive players, use the posteam
-                        team = first_play['posteam'] if first_play['posteam'] == first_play['home_team'] or first_play['posteam'] == first_play['away_team'] else first_play['home_team']
-                    
-                    # Calculate fantasy points (basic scoring)
-                    fantasy_points = (
-                        (passing_yards / 25) + (passing_tds * 4) + (rushing_yards / 10) + (rushing_tds * 6) +
-                        (receiving_yards / 10) + (receiving_tds * 6) + receptions - (interceptions * 2)
-                    )
-                    
-                    weekly_stats.append({
-                        'player_name': player,
-                        'recent_team': team,
-                        'week': int(week),
-                        'season': int(first_play['season']),
-                        'passing_yards': float(passing_yards) if pd.notna(passing_yards) else 0.0,
-                        'passing_tds': int(passing_tds) if pd.notna(passing_tds) else 0,
-                        'attempts': int(passing_attempts) if pd.notna(passing_attempts) else 0,
-                        'completions': int(passing_completions) if pd.notna(passing_completions) else 0,
-                        'interceptions': int(interceptions) if pd.notna(interceptions) else 0,
-                        'rushing_yards': float(rushing_yards) if pd.notna(rushing_yards) else 0.0,
-                        'rushing_tds': int(rushing_tds) if pd.notna(rushing_tds) else 0,
-                        'carries': int(rushing_attempts) if pd.notna(rushing_attempts) else 0,
-                        'receiving_yards': float(receiving_yards) if pd.notna(receiving_yards) else 0.0,
-                        'receiving_tds': int(receiving_tds) if pd.notna(receiving_tds) else 0,
-                        'receptions': int(receptions) if pd.notna(receptions) else 0,
-                        'targets': int(targets) if pd.notna(targets) else 0,
-                        'fantasy_points': float(fantasy_points) if pd.notna(fantasy_points) else 0.0,
-                        'sacks': int(sacks),
-                        'tackles': int(solo_tackles),
-                        'assists': int(assist_tackles),
-                        'field_goals_made': int(field_goals_made),
-                        'field_goals_attempted': int(field_goals_attempted),
-                        'kicking_points': int(kicking_points),
-                        'special_teams_tds': 0.0  # Not available in basic PBP
-                    })
+            # Names and team codes repeat across thousands of plays: one shared categorical dtype per kind makes
+            # grouping work on integer codes, and keeps the per-role frames aligned when they're joined
+            player_columns = [col for _, col in role_columns]
+            for cols in (player_columns, ['posteam', 'defteam', 'home_team', 'away_team']):
+                values = pd.Series(plays[cols].to_numpy().ravel()).dropna().unique()
+                plays[cols] = plays[cols].astype(pd.CategoricalDtype(values))
+            
+            # Stack the name columns end to end: row k * len(plays) + i is play i's credit in role_columns[k]
+            roles = list(dict.fromkeys(role for role, _ in role_columns))
+            role_codes = [roles.index(role) for role, _ in role_columns]
+            credits = pd.DataFrame({
+                'play': np.tile(plays.index.to_numpy(), len(role_columns)),
+                'week': np.tile(plays['week'].to_numpy(), len(role_columns)),
+                'player_name': pd.concat([plays[col] for col in player_columns], ignore_index=True),
+                'role': pd.Categorical.from_codes(np.repeat(role_codes, len(plays)), categories=roles)
+            })
+            credits = credits[credits['player_name'].notna() & (credits['player_name'] != '')]
+            if credits.empty:
+                return pd.DataFrame()
             
-            return pd.DataFrame(weekly_stats)
+            # One grouped pass gives each player's first play and credit count per role
+            by_role = credits.groupby(keys + ['role'], sort=False, observed=True)['play'].agg(['min', 'size'])
+            first_play_idx = by_role['min'].groupby(level=keys, sort=False, observed=True).min()
+            role_counts = by_role['size'].unstack('role', fill_value=0)
+            role_counts = role_counts.reindex(columns=['sack', 'solo_tackle', 'assist_tackle'], fill_value=0)
+            
+            def by_player(rows, col, **aggs):
+                """Aggregate the given plays per player named in col and week"""
+                rows = rows[rows[col].notna() & (rows[col] != '')]
+                return rows.groupby([col, 'week'], sort=False, observed=True).agg(**aggs).rename_axis(keys)
+            
+            # One grouped pass per role; each player's stats are the sums over the plays they're credited on
+            passing = by_player(plays, 'passer_player_name',
+                                passing_yards=('passing_yards', 'sum'), passing_tds=('pass_touchdown', 'sum'),
+                                attempts=('passing_yards', 'size'), completions=('complete_pass', 'sum'),
+                                interceptions=('interception', 'sum'))
+            rushing = by_player(plays, 'rusher_player_name',
+                                rushing_yards=('rushing_yards', 'sum'), rushing_tds=('rush_touchdown', 'sum'),
+                                carries=('rushing_yards', 'size'))
+            receiving = by_player(plays, 'receiver_player_name',
+                                  receiving_yards=('receiving_yards', 'sum'), receiving_tds=('pass_touchdown', 'sum'),
+                                  receptions=('complete_pass', 'sum'), targets=('receiving_yards', 'size'))
+            # Field goal flags as int8 columns so the kicker aggregation is a plain sum, no Python lambda per group
+            field_goal = plays['field_goal_attempt'] == 1
+            plays['_fg_att'] = field_goal.astype(np.int8)
+            plays['_fg_made'] = (field_goal & (plays['field_goal_result'] == 'made')).astype(np.int8)
+            kicking = by_player(plays[field_goal], 'kicker_player_name',
+                                field_goals_made=('_fg_made', 'sum'), field_goals_attempted=('_fg_att', 'sum'))
+            
+            stats = pd.DataFrame(index=first_play_idx.index).join([passing, rushing, receiving, kicking]).fillna(0)
+            stats = stats.join(role_counts.rename(columns={'sack': 'sacks', 'solo_tackle': 'tackles', 'assist_tackle': 'assists'}))
+            
+            # Team comes from each player's first play: defensive players take the defteam, kickers the
+            # posteam of their first field goal or extra point, everyone else the posteam (or home team)
+            first_play = plays.loc[first_play_idx.to_numpy()].set_index(first_play_idx.index)
+            on_field = first_play['posteam'].eq(first_play['home_team']) | first_play['posteam'].eq(first_play['away_team'])
+            team = first_play['posteam'].where(on_field, first_play['home_team'])
+            
+            kicks = plays[(plays['field_goal_attempt'] == 1) | (plays['extra_point_attempt'] == 1)]
+            kicks = kicks[kicks['kicker_player_name'].notna()].drop_duplicates(['kicker_player_name', 'week'])
+            kick_team = kicks.set_index(['kicker_player_name', 'week'])['posteam'].rename_axis(keys)
+            has_kick = stats.index.isin(kick_team.index)
+            team[has_kick] = kick_team.reindex(stats.index)[has_kick]
+            
+            defensive = stats[['sacks', 'tackles', 'assists']].to_numpy().sum(axis=1) > 0
+            team[defensive] = first_play['defteam'][defensive]
+            
+            # Calculate fantasy points (basic scoring) on the raw arrays, skipping index alignment
+            columns = {col: stats[col].to_numpy(dtype=float) for col in
+                       ('passing_yards', 'passing_tds', 'rushing_yards', 'rushing_tds',
+                        'receiving_yards', 'receiving_tds', 'receptions', 'interceptions')}
+            stats['fantasy_points'] = (
+                (columns['passing_yards'] / 25) + (columns['passing_tds'] * 4) + (columns['rushing_yards'] / 10) + (columns['rushing_tds'] * 6) +
+                (columns['receiving_yards'] / 10) + (columns['receiving_tds'] * 6) + columns['receptions'] - (columns['interceptions'] * 2)
+            )
+            stats['kicking_points'] = stats['field_goals_made'].to_numpy() * 3
+            stats['special_teams_tds'] = 0.0  # Not available in basic PBP
+            stats['recent_team'] = team
+            stats['season'] = first_play['season']
+            
+            # Narrow dtypes: per-week counts fit int16 and yardage totals are whole numbers, exact in float32;
+            # fantasy points keep float64 so the values written back to the sheets don't pick up rounding noise
+            yard_columns = ['passing_yards', 'rushing_yards', 'receiving_yards']
+            count_columns = ['week', 'season', 'passing_tds', 'attempts', 'completions', 'interceptions', 'rushing_tds',
+                             'carries', 'receiving_tds', 'receptions', 'targets', 'sacks', 'tackles', 'assists',
+                             'field_goals_made', 'field_goals_attempted', 'kicking_points']
+            dtypes = {**dict.fromkeys(yard_columns, 'float32'), **dict.fromkeys(count_columns, 'int16'),
+                      'fantasy_points': 'float64', 'special_teams_tds': 'float32'}
+            stats = stats.reset_index().astype(dtypes)
+            
+            return stats[['player_name', 'recent_team', 'week', 'season', 'passing_yards', 'passing_tds', 'attempts',
+                          'completions', 'interceptions', 'rushing_yards', 'rushing_tds', 'carries', 'receiving_yards',
+                          'receiving_tds', 'receptions', 'targets', 'fantasy_points', 'sacks', 'tackles', 'assists',
+                          'field_goals_made', 'field_goals_attempted', 'kicking_points', 'special_teams_tds']]
             
         except Exception as e:
             cprint(f"Error converting PBP to weekly stats: {e}", "red")
@@ -412,124 +460,109 @@ class NFLStatsFetcher:
                 return None
             
             # Look for games where either team is home or away
-            game_match = game_data[
-                ((game_data['home_team'] == team_code) & (game_data['away_team'] == opponent_code)) |
-                ((game_data['home_team'] == opponent_code) & (game_data['away_team'] == team_code))
-            ]
-            
-            if not game_match.empty:
-                return int(game_match.iloc[0]['week'])
-            
-            return None
+            return self._week_lookup[year].get(frozenset((team_code, opponent_code)))
             
         except Exception as e:
             cprint(f"Error finding game week: {e}", "red")
             return None
 
+    def _get_stats_index(self, stats_data: pd.DataFrame) -> Dict[tuple, int]:
+        """Row positions keyed by (team, week, name) and (team, week, initial, last name), built once per stats frame"""
+        if self._stats_index_source is stats_data:
+            return self._stats_index
+        
+        # Normalize every name and split out abbreviated forms in vectorized passes over the name column
+        pbp_names = stats_data['player_name'].str.lower().str.strip()
+        abbreviated = pbp_names.str.extract(_ABBREVIATED_NAME_RE)
+        initials = abbreviated[0].fillna(abbreviated[2])
+        last_names = abbreviated[1].fillna(abbreviated[3])
+        
+        # Only the key columns are walked; a matched row is pulled out by position when needed
+        index = {}
+        key_rows = zip(pbp_names, stats_data['recent_team'], stats_data['week'], initials, last_names)
+        for position, (pbp_name, team, week, initial, last_name) in enumerate(key_rows):
+            if not isinstance(pbp_name, str):
+                continue
+            team_week = (team, week)
+            # First row wins, same as scanning the team/week rows in order
+            index.setdefault(team_week + (pbp_name,), position)
+            if isinstance(initial, str):
+                index.setdefault(team_week + (initial, last_name), position)
+        
+        # Normalized first/last name columns for the vectorized partial match
+        name_parts = pbp_names.str.split()
+        self._stats_names = pd.DataFrame({
+            'parts': name_parts.str.len(),
+            'first': name_parts.str[0],
+            'last': name_parts.str[-1]
+        })
+        
+        # Row positions for each (team, week), so a lookup never rescans the whole frame
+        self._team_week_rows = stats_data.groupby(['recent_team', 'week'], sort=False, observed=True).indices
+        
+        self._stats_index_source = stats_data
+        self._stats_index = index
+        return index
+
+    def _find_player_stats(self, stats_data: pd.DataFrame, player_name: str,
+                           stat_type: str, team: str, week: int) -> Optional[pd.Series]:
+        """Find a player's stats row for a team and week, trying looser name matches in turn"""
+        if stats_data.empty:
+            return None
+        
+        # Normalize player name for matching
+        player_name_lower = player_name.lower().strip()
+        
+        team_code = self.team_mapping.get(team)
+        if not team_code:
+            return None
+        
+        # Try exact match first
+        index = self._get_stats_index(stats_data)
+        exact = index.get((team_code, week, player_name_lower))
+        if exact is not None:
+            return stats_data.iloc[exact]
+        
+        # Filter by team and week
+        team_week = self._team_week_rows.get((team_code, week))
+        
+        if team_week is None:
+            return None
+        
+        # Try partial match if exact fails: our first and last names inside theirs
+        name_parts = player_name_lower.split()
+        if len(name_parts) >= 2:
+            candidates = self._stats_names.iloc[team_week]
+            partial = ((candidates['parts'] >= 2) &
+                       candidates['first'].str.contains(name_parts[0], regex=False, na=False) &
+                       candidates['last'].str.contains(name_parts[-1], regex=False, na=False)).to_numpy()
+            if partial.any():
+                return stats_data.iloc[team_week[partial.argmax()]]
+        
+        # Try abbreviated name matching (e.g., "Jalen Hurts" vs "J.Hurts" or "J Hurts"): any prefix of our
+        # first name as the initial and any suffix of our name as the last name, earliest row wins
+        if name_parts:
+            first_name = name_parts[0]
+            matches = [
+                index.get((team_code, week, first_name[:end], player_name_lower[start:]))
+                for end in range(len(first_name) + 1)
+                for start in range(len(player_name_lower) + 1)
+            ]
+            matches = [match for match in matches if match is not None]
+            if matches:
+                return stats_data.iloc[min(matches)]
+        
+        # Debug: Show available players for this team/week
+        available_players = stats_data['player_name'].iloc[team_week].tolist()
+        cprint(f"Could not find stats for {player_name} ({stat_type}) - Available players: {available_players[:5]}", "red")
+        return None
+
     def get_player_stat_value(self, stats_data: pd.DataFrame, player_name: str, 
                             stat_type: str, team: str, week: int) -> Optional[float]:
         """Get a specific stat value for a player"""
         try:
-            if stats_data.empty:
-                return None
-            
-            # Normalize player name for matching
-            player_name_lower = player_name.lower().strip()
-            
-            # Filter by team and week
-            team_code = self.team_mapping.get(team)
-            if not team_code:
-                return None
-            
-            team_week_data = stats_data[(stats_data['recent_team'] == team_code) & (stats_data['week'] == week)]
-            
-            if team_week_data.empty:
-                return None
-            
-            # Find player by name (try different name matching strategies)
-            player_match = None
-            
-            # Try exact match first
-            for _, player in team_week_data.iterrows():
-                if player['player_name'].lower().strip() == player_name_lower:
-                    player_match = player
-                    break
-            
-            # Try partial match if exact fails
-            if player_match is None:
-                name_parts = player_name_lower.split()
-                for _, player in team_week_data.iterrows():
-                    player_name_parts = player['player_name'].lower().strip().split()
-                    if len(name_parts) >= 2 and len(player_name_parts) >= 2:
-                        if (name_parts[0] in player_name_parts[0] and 
-                            name_parts[-1] in player_name_parts[-1]):
-                            player_match = player
-                            break
-            
-            # Try abbreviated name matching (e.g., "Jalen Hurts" vs "J.Hurts" or "J Hurts")
+            player_match = self._find_player_stats(stats_data, player_name, stat_type, team, week)
             if player_match is None:
-                for _, player in team_week_data.iterrows():
-                    pbp_name = player['player_name'].lower().strip()
-                    
-                    # Handle "J.Hurts" format
-                    if '.' in pbp_name:
-                        pbp_parts = pbp_name.split('.')
-                        if len(pbp_parts) == 2:
-                            first_initial = pbp_parts[0]
-                            last_name = pbp_parts[1]
-                            # Check if our player's first name starts with the initial and last names match
-                            if (player_name_lower.split()[0].startswith(first_initial) and 
-                                player_name_lower.endswith(last_name)):
-                                player_match = player
-                                break
-                    
-                    # Handle "J Hurts" format (first initial + space + last name)
-                    elif ' ' in pbp_name:
-                        pbp_parts = pbp_name.split(' ', 1)
-                        if len(pbp_parts) == 2 and len(pbp_parts[0]) == 1:
-                            first_initial = pbp_parts[0]
-                            last_name = pbp_parts[1]
-                            # Check if our player's first name starts with the initial and last names match
-                            if (player_name_lower.split()[0].startswith(first_initial) and 
-                                player_name_lower.endswith(last_name)):
-                                player_match = player
-                                break
-            
-            # Try reverse abbreviated matching (e.g., "J.Hurts" or "J Hurts" vs "Jalen Hurts")
-            if player_match is None:
-                name_parts = player_name_lower.split()
-                if len(name_parts) >= 2:
-                    first_name = name_parts[0]
-                    last_name = name_parts[-1]
-                    first_initial = first_name[0]
-                    
-                    for _, player in team_week_data.iterrows():
-                        pbp_name = player['player_name'].lower().strip()
-                        
-                        # Handle "J.Hurts" format
-                        if '.' in pbp_name:
-                            pbp_parts = pbp_name.split('.')
-                            if len(pbp_parts) == 2:
-                                pbp_initial = pbp_parts[0]
-                                pbp_last = pbp_parts[1]
-                                if (first_initial == pbp_initial and last_name == pbp_last):
-                                    player_match = player
-                                    break
-                        
-                        # Handle "J Hurts" format
-                        elif ' ' in pbp_name:
-                            pbp_parts = pbp_name.split(' ', 1)
-                            if len(pbp_parts) == 2 and len(pbp_parts[0]) == 1:
-                                pbp_initial = pbp_parts[0]
-                                pbp_last = pbp_parts[1]
-                                if (first_initial == pbp_initial and last_name == pbp_last):
-                                    player_match = player
-                                    break
-            
-            if player_match is None:
-                # Debug: Show available players for this team/week
-                available_players = [p['player_name'] for p in team_week_data.to_dict('records')]
-                cprint(f"Could not find stats for {player_name} ({stat_type}) - Available players: {available_players[:5]}", "red")
                 return None
             
             # Get the stat value
@@ -559,127 +592,26 @@ class NFLStatsFetcher:
                                stat_type: str, team: str, week: int) -> Optional[float]:
         """Calculate combined stats like Rush+Rec Yds, Pass+Rush Yds, etc."""
         try:
-            if stats_data.empty:
-                return None
-            
-            player_name_lower = player_name.lower().strip()
-            team_code = self.team_mapping.get(team)
-            if not team_code:
-                return None
-            
-            # Filter by team and week
-            team_week_data = stats_data[(stats_data['recent_team'] == team_code) & (stats_data['week'] == week)]
-            
-            if team_week_data.empty:
-                return None
-            
-            # Find player by name
-            player_match = None
-            for _, player in team_week_data.iterrows():
-                if player['player_name'].lower().strip() == player_name_lower:
-                    player_match = player
-                    break
-            
-            # Try partial match if exact fails
-            if player_match is None:
-                name_parts = player_name_lower.split()
-                for _, player in team_week_data.iterrows():
-                    player_name_parts = player['player_name'].lower().strip().split()
-                    if len(name_parts) >= 2 and len(player_name_parts) >= 2:
-                        if (name_parts[0] in player_name_parts[0] and 
-                            name_parts[-1] in player_name_parts[-1]):
-                            player_match = player
-                            break
-            
-            # Try abbreviated name matching (e.g., "Jalen Hurts" vs "J.Hurts" or "J Hurts")
-            if player_match is None:
-                for _, player in team_week_data.iterrows():
-                    pbp_name = player['player_name'].lower().strip()
-                    
-                    # Handle "J.Hurts" format
-                    if '.' in pbp_name:
-                        pbp_parts = pbp_name.split('.')
-                        if len(pbp_parts) == 2:
-                            first_initial = pbp_parts[0]
-                            last_name = pbp_parts[1]
-                            # Check if our player's first name starts with the initial and last names match
-                            if (player_name_lower.split()[0].startswith(first_initial) and 
-                                player_name_lower.endswith(last_name)):
-                                player_match = player
-                                break
-                    
-                    # Handle "J Hurts" format (first initial + space + last name)
-                    elif ' ' in pbp_name:
-                        pbp_parts = pbp_name.split(' ', 1)
-                        if len(pbp_parts) == 2 and len(pbp_parts[0]) == 1:
-                            first_initial = pbp_parts[0]
-                            last_name = pbp_parts[1]
-                            # Check if our player's first name starts with the initial and last names match
-                            if (player_name_lower.split()[0].startswith(first_initial) and 
-                                player_name_lower.endswith(last_name)):
-                                player_match = player
-                                break
-            
-            # Try reverse abbreviated matching (e.g., "J.Hurts" or "J Hurts" vs "Jalen Hurts")
+            player_match = self._find_player_stats(stats_data, player_name, stat_type, team, week)
             if player_match is None:
-                name_parts = player_name_lower.split()
-                if len(name_parts) >= 2:
-                    first_name = name_parts[0]
-                    last_name = name_parts[-1]
-                    first_initial = first_name[0]
-                    
-                    for _, player in team_week_data.iterrows():
-                        pbp_name = player['player_name'].lower().strip()
-                        
-                        # Handle "J.Hurts" format
-                        if '.' in pbp_name:
-                            pbp_parts = pbp_name.split('.')
-                            if len(pbp_parts) == 2:
-                                pbp_initial = pbp_parts[0]
-                                pbp_last = pbp_parts[1]
-                                if (first_initial == pbp_initial and last_name == pbp_last):
-                                    player_match = player
-                                    break
-                        
-                        # Handle "J Hurts" format
-                        elif ' ' in pbp_name:
-                            pbp_parts = pbp_name.split(' ', 1)
-                            if len(pbp_parts) == 2 and len(pbp_parts[0]) == 1:
-                                pbp_initial = pbp_parts[0]
-                                pbp_last = pbp_parts[1]
-                                if (first_initial == pbp_initial and last_name == pbp_last):
-                                    player_match = player
-                                    break
-            
-            if player_match is None:
-                # Debug: Show available players for this team/week
-                available_players = [p['player_name'] for p in team_week_data.to_dict('records')]
-                cprint(f"Could not find stats for {player_name} ({stat_type}) - Available players: {available_players[:5]}", "red")
                 return None
             
+            # Stats frames have their missing numbers filled with zero when loaded
             if stat_type == 'Rush+Rec Yds':
-                rush_yards = float(player_match['rushing_yards']) if pd.notna(player_match['rushing_yards']) else 0.0
-                rec_yards = float(player_match['receiving_yards']) if pd.notna(player_match['receiving_yards']) else 0.0
-                return rush_yards + rec_yards
+                return float(player_match['rushing_yards']) + float(player_match['receiving_yards'])
             
             elif stat_type == 'Rush+Rec TDs':
-                rush_tds = float(player_match['rushing_tds']) if pd.notna(player_match['rushing_tds']) else 0.0
-                rec_tds = float(player_match['receiving_tds']) if pd.notna(player_match['receiving_tds']) else 0.0
-                return rush_tds + rec_tds
+                return float(player_match['rushing_tds']) + float(player_match['receiving_tds'])
             
             elif stat_type == 'Pass+Rush Yds':
-                pass_yards = float(player_match['passing_yards']) if pd.notna(player_match['passing_yards']) else 0.0
-                rush_yards = float(player_match['rushing_yards']) if pd.notna(player_match['rushing_yards']) else 0.0
-                return pass_yards + rush_yards
+                return float(player_match['passing_yards']) + float(player_match['rushing_yards'])
             
             elif stat_type == 'Fantasy Score':
                 # Use the built-in fantasy points from nfl_data_py
-                return float(player_match['fantasy_points']) if pd.notna(player_match['fantasy_points']) else 0.0
+                return float(player_match['fantasy_points'])
             
             elif stat_type == 'Tackles+Ast':
-                tackles = float(player_match['tackles']) if pd.notna(player_match['tackles']) else 0.0
-                assists = float(player_match['assists']) if pd.notna(player_match['assists']) else 0.0
-                return tackles + assists
+                return float(player_match['tackles']) + float(player_match['assists'])
             
             return None
             
@@ -697,23 +629,26 @@ class NFLStatsFetcher:
             cprint("Could not fetch player stats data", "red")
             return 0
         
+        # One clock reading for the whole sheet
+        now = datetime.now()
+        
         for player in players:
             if player['actual']:  # Skip if already has actual result
                 continue
             
-            game_date = self.parse_game_date(player['game_time'])
+            game_date = self.parse_game_date(player['game_time'], now)
             if not game_date:
                 cprint(f"Could not parse game date for {player['player_name']}", "red")
                 continue
             
             # Check if game has been played (game date is in the past)
             if isinstance(game_date, datetime):
-                if game_date > datetime.now():
+                if game_date > now:
                     cprint(f"Game for {player['player_name']} hasn't been played yet", "yellow")
                     continue
             else:
                 # If it's a date object, compare with today's date
-                if game_date > datetime.now().date():
+                if game_date > now.date():
                     cprint(f"Game for {player['player_name']} hasn't been played yet", "yellow")
                     continue
             
@@ -794,6 +729,7 @@ class NFLStatsFetcher:
             return
         
         sheet_names = self.get_all_sheets()
+        sheet_players = self.read_all_sheets(sheet_names)
         total_updates = 0
         
         cprint(f"\n🏈 Starting NFL Stats Fetch for {len(sheet_names)} sheets...", "green", attrs=["bold"])
@@ -801,7 +737,7 @@ class NFLStatsFetcher:
         
         for sheet_name in sheet_names:
             cprint(f"\n📊 Processing sheet: {sheet_name}", "cyan", attrs=["bold"])
-            players = self.read_sheet_data(sheet_name)
+            players = sheet_players.get(sheet_name, [])
             
             if not players:
                 cprint(f"No players found in {sheet_name}", "yellow")
@@ -816,10 +752,10 @@ class NFLStatsFetcher:
         
         cprint(f"\n🎯 Total updates across all sheets: {total_updates}", "green", attrs=["bold"])
 
-def main():
+def main(sheets_service=None):
     spreadsheet_id = "1H9HcjtjoG9AlRJ3lAvgZXpefYfuVcylwqc4D4B_Ai1g"
     
-    fetcher = NFLStatsFetcher(spreadsheet_id)
+    fetcher = NFLStatsFetcher(spreadsheet_id, sheets_service=sheets_service)
     fetcher.fetch_all_actual_results()
 
 if __name__ == "__main__":
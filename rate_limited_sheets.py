@@ -2,11 +2,41 @@
 Rate-limited Google Sheets operations to avoid API quota exceeded errors
 """
 
+import threading
 import time
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from termcolor import cprint
 
+class RateLimiter:
+    """Token bucket allowing `rate` requests every `per` seconds"""
+    def __init__(self, rate=60, per=60.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping only as long as needed for the bucket to refill"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate / self.per)
+            self._last_refill = now
+            
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) * self.per / self.rate
+                time.sleep(wait_time)
+                self._tokens = 1
+                self._last_refill = time.monotonic()
+            
+            self._tokens -= 1
+
+# Sheet titles per spreadsheet id as (fetched_at, titles), shared by every service
+# instance so repeated monitor-triggered scrapes skip the metadata request
+SHEET_TITLES_TTL = 600
+_SHEET_TITLES_CACHE = {}
+
 class RateLimitedSheetsService:
     def __init__(self, service_account_file='service-account-key.json'):
         self.service = self._setup_service(service_account_file)
@@ -129,19 +159,59 @@ class RateLimitedSheetsService:
             cprint(f"Get values error: {e}", "red")
             return None
     
-    def get_spreadsheet(self, spreadsheet_id):
-        """Get spreadsheet metadata with rate limiting"""
+    def batch_get_values(self, spreadsheet_id, ranges):
+        """Get several ranges in a single request with rate limiting"""
+        if not self.service:
+            return None
+        
+        self._wait_if_needed()
+        
+        try:
+            result = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                fields='valueRanges.values'
+            ).execute()
+            return [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+        except Exception as e:
+            cprint(f"Batch get values error: {e}", "red")
+            return None
+    
+    def get_spreadsheet(self, spreadsheet_id, fields=None):
+        """Get spreadsheet metadata with rate limiting, optionally limited to the given fields"""
         if not self.service:
             return None
         
         self._wait_if_needed()
         
         try:
+            if fields:
+                return self.service.spreadsheets().get(spreadsheetId=spreadsheet_id, fields=fields).execute()
             return self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
         except Exception as e:
             cprint(f"Get spreadsheet error: {e}", "red")
             return None
 
+    def get_sheet_titles(self, spreadsheet_id):
+        """Get the spreadsheet's sheet titles, reusing a recent lookup when available"""
+        cached = _SHEET_TITLES_CACHE.get(spreadsheet_id)
+        if cached and time.monotonic() - cached[0] < SHEET_TITLES_TTL:
+            return cached[1]
+        
+        sheet_metadata = self.get_spreadsheet(spreadsheet_id, fields='sheets.properties.title')
+        if not sheet_metadata:
+            return None
+        
+        titles = {sheet['properties']['title'] for sheet in sheet_metadata.get('sheets', [])}
+        _SHEET_TITLES_CACHE[spreadsheet_id] = (time.monotonic(), titles)
+        return titles
+    
+    def add_cached_sheet_title(self, spreadsheet_id, title):
+        """Record a sheet created by this process so the cached titles stay accurate"""
+        cached = _SHEET_TITLES_CACHE.get(spreadsheet_id)
+        if cached:
+            cached[1].add(title)
+
 def create_rate_limited_sheets_service():
     """Create a rate-limited Google Sheets service"""
     return RateLimitedSheetsService()
@@ -9,11 +9,13 @@ from termcolor import cprint
 import pandas as pd
 
 class ResultsAnalyzer:
-    def __init__(self, spreadsheet_id: str, service_account_file: str = 'service-account-key.json'):
+    def __init__(self, spreadsheet_id: str, service_account_file: str = 'service-account-key.json', service=None):
         self.spreadsheet_id = spreadsheet_id
         self.service_account_file = service_account_file
-        self.service = None
+        self.service = service
         self.data = []
+        self._bets_by_stat_type = None
+        self._sheet_data_cache = {}
         
     def initialize_service(self):
         """Initialize Google Sheets service"""
@@ -36,7 +38,8 @@ class ResultsAnalyzer:
         
         try:
             spreadsheet = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties.title'
             ).execute()
             
             sheets = spreadsheet.get('sheets', [])
@@ -52,8 +55,14 @@ class ResultsAnalyzer:
             cprint(f"Error listing sheets: {e}", "red")
             return []
     
-    def load_sheet_data(self, sheet_name: str) -> bool:
-        """Load data from a specific sheet"""
+    def load_sheet_data(self, sheet_name: str, refresh: bool = False) -> bool:
+        """Load data from a specific sheet, reusing this session's earlier load unless refresh is set"""
+        if not refresh and sheet_name in self._sheet_data_cache:
+            self.data = self._sheet_data_cache[sheet_name]
+            self._bets_by_stat_type = None
+            cprint(f"Using {len(self.data)} completed bets already loaded from '{sheet_name}'", "green")
+            return True
+        
         if not self.service:
             if not self.initialize_service():
                 return False
@@ -73,6 +82,7 @@ class ResultsAnalyzer:
             
             # Parse data into structured format
             self.data = []
+            self._bets_by_stat_type = None
             headers = values[0]
             total_rows = 0
             filtered_rows = 0
@@ -117,6 +127,7 @@ class ResultsAnalyzer:
                         self.data.append(player_data)
                         filtered_rows += 1
             
+            self._sheet_data_cache[sheet_name] = self.data
             cprint(f"Processed {total_rows} rows, filtered to {filtered_rows} completed bets from '{sheet_name}'", "green")
             return True
             
@@ -124,6 +135,18 @@ class ResultsAnalyzer:
             cprint(f"Error loading data from sheet '{sheet_name}': {e}", "red")
             return False
     
+    def clear_sheet_cache(self):
+        """Forget previously loaded sheets so the next load reads them again"""
+        self._sheet_data_cache.clear()
+    
+    def bets_for_stat_type(self, stat_type: str) -> List[Dict[str, Any]]:
+        """Get the loaded bets for one stat type, indexing the data on first use"""
+        if self._bets_by_stat_type is None:
+            self._bets_by_stat_type = defaultdict(list)
+            for bet in self.data:
+                self._bets_by_stat_type[bet['stat_type']].append(bet)
+        return self._bets_by_stat_type.get(stat_type, [])
+    
     def get_stat_type_from_line(self, line_value: float, position: str) -> str:
         """Infer stat type from line value and position"""
         if position == 'QB':
@@ -150,38 +173,31 @@ class ResultsAnalyzer:
         else:
             return 'Unknown'
     
-    def calculate_over_under_ratios(self) -> Dict[str, Any]:
-        """Calculate comprehensive over/under ratios"""
-        if not self.data:
+    def calculate_over_under_ratios(self, bets: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Calculate comprehensive over/under ratios for the given bets (all loaded data by default)"""
+        if bets is None:
+            bets = self.data
+        if not bets:
             return {}
         
-        # Initialize counters
-        stat_type_ratios = defaultdict(lambda: {'over': 0, 'under': 0, 'total': 0})
-        player_ratios = defaultdict(lambda: {'over': 0, 'under': 0, 'total': 0})
-        team_ratios = defaultdict(lambda: {'over': 0, 'under': 0, 'total': 0})
-        position_ratios = defaultdict(lambda: {'over': 0, 'under': 0, 'total': 0})
-        
-        # Process each bet
-        for bet in self.data:
-            over_under = bet['over_under'].lower()
-            if over_under not in ['over', 'under']:
-                continue
-            
-            # Use the actual stat type from the data
-            stat_type = bet['stat_type']
-            
-            # Update counters
-            stat_type_ratios[stat_type][over_under] += 1
-            stat_type_ratios[stat_type]['total'] += 1
-            
-            player_ratios[bet['player_name']][over_under] += 1
-            player_ratios[bet['player_name']]['total'] += 1
-            
-            team_ratios[bet['team']][over_under] += 1
-            team_ratios[bet['team']]['total'] += 1
-            
-            position_ratios[bet['position']][over_under] += 1
-            position_ratios[bet['position']]['total'] += 1
+        # Project the settled bets into columns once; each grouping below then
+        # reads only its own key column alongside the shared outcome column
+        outcomes = [bet['over_under'].lower() for bet in bets]
+        settled = [i for i, over_under in enumerate(outcomes) if over_under in ('over', 'under')]
+        outcomes = [outcomes[i] for i in settled]
+        
+        def count_by(column):
+            counts = Counter(zip([bets[i][column] for i in settled], outcomes))
+            ratios = defaultdict(lambda: {'over': 0, 'under': 0, 'total': 0})
+            for (key, over_under), count in counts.items():
+                ratios[key][over_under] += count
+                ratios[key]['total'] += count
+            return ratios
+        
+        stat_type_ratios = count_by('stat_type')
+        player_ratios = count_by('player_name')
+        team_ratios = count_by('team')
+        position_ratios = count_by('position')
         
         # Calculate percentages
         def calculate_percentages(ratios_dict):
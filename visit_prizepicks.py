@@ -2,6 +2,7 @@ from seleniumbase import SB
 import pyautogui
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
@@ -199,7 +200,7 @@ def run_monitoring_scraping(games_info, sheets_service=None):
             from monitor import parse_game_time
             current_time = datetime.now()
             for game in games_list:
-                game_datetime = parse_game_time(game['game_time_str'])
+                game_datetime = parse_game_time(game['game_time_str'], current_time)
                 if game_datetime:
                     time_diff_minutes = (game_datetime - current_time).total_seconds() / 60
                     if time_diff_minutes <= 60:
@@ -302,35 +303,60 @@ def setup_google_sheets():
         cprint("Please ensure you have a service account key file named 'service-account-key.json'", "yellow")
         return None
 
+def index_existing_rows(values):
+    """Build a player-key lookup of existing rows (columns A:F) so only changed lines are rewritten"""
+    # Skip header row and build a lookup dictionary
+    existing_data = {}
+    for i, row in enumerate(values[1:], start=2):  # Start from row 2 (skip header)
+        # Short rows and cleared rows (no player name) are rejected before any key is built
+        if len(row) < 6 or not row[0]:
+            continue
+        
+        # Create a unique key from player name, team, opponent, and game time
+        player_key = f"{row[0]}|{row[2]}|{row[3]}|{row[4]}".lower().strip()
+        existing_data[player_key] = {
+            'row_index': i,
+            'line': row[5]
+        }
+    
+    return existing_data
+
 def read_existing_sheet_data(service, spreadsheet_id, sheet_name):
     """Read existing data from the sheet to preserve Actual and Over/Under columns"""
     try:
-        # Read all data from the sheet using rate-limited service
-        range_name = f"'{sheet_name}'!A:I"
+        # Only the key columns and Line (A:F) are compared, so skip the rest
+        range_name = f"'{sheet_name}'!A:F"
         values = service.get_values(spreadsheet_id, range_name)
         if not values:
             return {}
         
-        # Skip header row and build a lookup dictionary
-        existing_data = {}
-        for i, row in enumerate(values[1:], start=2):  # Start from row 2 (skip header)
-            if len(row) >= 6:  # Ensure we have at least the basic columns
-                # Create a unique key from player name, team, opponent, and game time
-                player_key = f"{row[0]}|{row[2]}|{row[3]}|{row[4]}".lower().strip()
-                existing_data[player_key] = {
-                    'row_index': i,
-                    'line': row[5] if len(row) > 5 else '',
-                    'actual': row[7] if len(row) > 7 else '',
-                    'over_under': row[8] if len(row) > 8 else '',
-                    'payout_type': row[6] if len(row) > 6 else 'Standard'
-                }
-        
-        return existing_data
+        return index_existing_rows(values)
     except Exception as e:
         cprint(f"Error reading existing sheet data: {e}", "red")
         return {}
 
-def create_or_update_sheet(service, spreadsheet_id, sheet_name, data):
+def read_existing_sheets_data(service, spreadsheet_id, sheet_names):
+    """Read existing data for several sheets with one batchGet, keyed by sheet name"""
+    try:
+        existing_titles = service.get_sheet_titles(spreadsheet_id)
+        if not existing_titles:
+            return {}
+        
+        # batchGet rejects the whole request if any range names a missing sheet
+        present = [name for name in dict.fromkeys(sheet_names) if name in existing_titles]
+        if not present:
+            return {}
+        
+        value_ranges = service.batch_get_values(spreadsheet_id, [f"'{name}'!A:F" for name in present])
+        if value_ranges is None:
+            return {}
+        
+        return {name: index_existing_rows(values) for name, values in zip(present, value_ranges)}
+    except Exception as e:
+        cprint(f"Error reading existing sheets data: {e}", "red")
+        return {}
+
+def create_or_update_sheet(service, spreadsheet_id, sheet_name, data, existing_data=None):
     """Create or update a worksheet with smart line updates only"""
     try:
         # Define the column headers based on your spreadsheet layout
@@ -349,13 +375,10 @@ def create_or_update_sheet(service, spreadsheet_id, sheet_name, data):
         # Check if sheet exists, if not create it
         sheet_exists = True
         try:
-            # Try to get the sheet using rate-limited service
-            sheet_metadata = service.get_spreadsheet(spreadsheet_id)
-            if sheet_metadata:
-                # Check if sheet exists by looking for it in the sheets list
-                sheet_names = [sheet['properties']['title'] for sheet in sheet_metadata.get('sheets', [])]
-                if sheet_name not in sheet_names:
-                    sheet_exists = False
+            # Check the (cached) sheet titles using rate-limited service
+            sheet_names = service.get_sheet_titles(spreadsheet_id)
+            if sheet_names is not None and sheet_name not in sheet_names:
+                sheet_exists = False
         except:
             sheet_exists = False
         
@@ -374,10 +397,12 @@ def create_or_update_sheet(service, spreadsheet_id, sheet_name, data):
             if not success:
                 cprint(f"Failed to create sheet {sheet_name}", "red")
                 return False
+            service.add_cached_sheet_title(spreadsheet_id, sheet_name)
         
-        # Read existing data if sheet exists
-        existing_data = {}
-        if sheet_exists:
+        # Read existing data if sheet exists and it wasn't prefetched
+        if not sheet_exists:
+            existing_data = {}
+        elif existing_data is None:
             existing_data = read_existing_sheet_data(service, spreadsheet_id, sheet_name)
         
         # Prepare data for update
@@ -559,6 +584,7 @@ def scrape_prop_type(sb, stat_name, target_teams=None, target_opponents=None, ta
     
     # Get all player cards from the projections list
     player_cards = sb.cdp.select_all('ul[aria-label="Projections List"] li')
+    scrape_now = datetime.now()
     
     for card in player_cards:
         try:
@@ -872,7 +898,7 @@ def scrape_prop_type(sb, stat_name, target_teams=None, target_opponents=None, ta
                                     opponent = time_text
                 
                 # Check if we should stop scraping due to different date
-                if stop_on_different_date and game_time and not is_game_today(game_time):
+                if stop_on_different_date and game_time and not is_game_today(game_time, scrape_now):
                     different_date_skipped += 1
                     cprint(f"📅 Stopping {stat_name} scraping - encountered game on different date: {game_time}", "yellow")
                     cprint(f"   This optimizes scraping by focusing on today's games only!", "cyan")
@@ -993,7 +1019,7 @@ def get_all_stat_types():
         "Tackles+Ast"
     ]
 
-def is_game_today(game_time_str):
+def is_game_today(game_time_str, now=None):
     """Check if a game time string represents a game from today"""
     if not game_time_str:
         return False
@@ -1012,7 +1038,8 @@ def is_game_today(game_time_str):
         
         # Import the parse_game_time function from monitor.py
         from monitor import parse_game_time
-        game_datetime = parse_game_time(game_time_str)
+        now = now or datetime.now()
+        game_datetime = parse_game_time(game_time_str, now)
         
         if not game_datetime:
             # If we can't parse it, assume it's today to be safe
@@ -1020,7 +1047,7 @@ def is_game_today(game_time_str):
             return True
         
         # Compare dates (not times)
-        today = datetime.now().date()
+        today = now.date()
         game_date = game_datetime.date()
         
         return game_date == today
@@ -1202,35 +1229,51 @@ def scrape_selected_stats(sb, sheets_service, selected_stat_types, target_teams=
         'total_expected': len(expected_players) if expected_players else 0
     }
     
-    for stat_type in stat_types:
-        try:
-            projections = scrape_prop_type(sb, stat_type, target_teams, target_opponents, target_game_time, stop_on_different_date, expected_players)
-            all_projections[stat_type] = projections
-            
-            # Track verification results
-            for player in projections:
-                player_key = f"{player.get('name', '')}|{player.get('team', '')}|{player.get('opponent', '')}|{player.get('game_time', '')}"
-                verification_results['found_players'].add(player_key)
-            
-            cprint(f"Completed scraping {stat_type}: {len(projections)} players found", "green")
-            
-            # Update Google Sheets if service is available
-            if sheets_service and SPREADSHEET_ID != "YOUR_SPREADSHEET_ID_HERE":
-                sheet_name = get_standardized_sheet_name(stat_type)  # Use standardized sheet name
-                success = create_or_update_sheet(sheets_service, SPREADSHEET_ID, sheet_name, projections)
-                if success:
-                    cprint(f"✓ Data uploaded to Google Sheets: {sheet_name}", "green")
+    # Read every selected sheet's existing rows in one request, in the background
+    # so the round trip overlaps with scraping the first stat type
+    prefetch = prefetch_pool = None
+    if sheets_service and SPREADSHEET_ID != "YOUR_SPREADSHEET_ID_HERE":
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        prefetch = prefetch_pool.submit(read_existing_sheets_data, sheets_service, SPREADSHEET_ID,
+                                        [get_standardized_sheet_name(stat_type) for stat_type in stat_types])
+    
+    try:
+        for stat_type in stat_types:
+            try:
+                projections = scrape_prop_type(sb, stat_type, target_teams, target_opponents, target_game_time, stop_on_different_date, expected_players)
+                all_projections[stat_type] = projections
+                
+                # Track verification results
+                for player in projections:
+                    player_key = f"{player.get('name', '')}|{player.get('team', '')}|{player.get('opponent', '')}|{player.get('game_time', '')}"
+                    verification_results['found_players'].add(player_key)
+                
+                cprint(f"Completed scraping {stat_type}: {len(projections)} players found", "green")
+                
+                # Update Google Sheets if service is available
+                if sheets_service and SPREADSHEET_ID != "YOUR_SPREADSHEET_ID_HERE":
+                    sheet_name = get_standardized_sheet_name(stat_type)  # Use standardized sheet name
+                    # Waits for the background read only the first time; later calls reuse its result
+                    prefetched_sheets = prefetch.result() if prefetch else {}
+                    success = create_or_update_sheet(sheets_service, SPREADSHEET_ID, sheet_name, projections,
+                                                     existing_data=prefetched_sheets.get(sheet_name))
+                    if success:
+                        cprint(f"✓ Data uploaded to Google Sheets: {sheet_name}", "green")
+                    else:
+                        cprint(f"✗ Failed to upload data to Google Sheets: {sheet_name}", "red")
                 else:
-                    cprint(f"✗ Failed to upload data to Google Sheets: {sheet_name}", "red")
-            else:
-                cprint("Skipping Google Sheets upload (service not available or ID not configured)", "yellow")
-            
-            # Small delay between stat types to avoid overwhelming the page
-            sb.cdp.sleep(1)
-            
-        except Exception as e:
-            cprint(f"Error scraping {stat_type}: {e}", "red")
-            all_projections[stat_type] = []
+                    cprint("Skipping Google Sheets upload (service not available or ID not configured)", "yellow")
+                
+                # Small delay between stat types to avoid overwhelming the page
+                sb.cdp.sleep(1)
+                
+            except Exception as e:
+                cprint(f"Error scraping {stat_type}: {e}", "red")
+                all_projections[stat_type] = []
+    finally:
+        # The worker shares sheets_service, so it must not outlive this call
+        if prefetch_pool:
+            prefetch_pool.shutdown(wait=True)
     
     # Calculate verification results
     if expected_players: